@@ -3,22 +3,51 @@ from wf_types import TypeCheck
 import wf_types
 import serial
 
+# Optional C implementation of the Modbus CRC-16 (pip install crcmod).
+# Only used when crcmod's compiled extension is available; its pure Python fallback is no faster than the table below.
+try:
+    import crcmod._crcfunext  # Only present when crcmod's C extension was built.
+    import crcmod.predefined
+    _crc16_modbus = crcmod.predefined.mkPredefinedCrcFun('modbus')
+except ImportError:
+    _crc16_modbus = None
+
+def _build_crc_table() -> tuple[int, ...]:
+    """
+    Build the 256-entry lookup table for the Modbus CRC-16 (polynomial 0xA001, reversed bit order).
+    Entry n is the result of running the 8 bitwise shift/XOR rounds on a CRC register holding n,
+    so calculate_modbus_crc only has to do one XOR and one lookup per message byte.
+    """
+    table = []
+    for value in range(256):
+        crc = value
+        for _ in range(8):
+
+            # If the LSB is 1, shift right and XOR with the polynomial, otherwise just shift right.
+            if crc & 0x0001: crc = (crc >> 1) ^ 0xA001
+            else: crc >>= 1
+        table.append(crc)
+    return tuple(table)
+
+# Built once at import and shared by every Modbus instance.
+_CRC_TABLE: tuple[int, ...] = _build_crc_table()
+
 class Modbus:
 
     # Declare class parameters.
     slave_address: int
     serial_connection: serial.Serial
 
-    def __init__(self, slave_address, com_port: str, timeout: float = 1.0):
+    def __init__(self, slave_address, com_port: str, timeout: float = 1.0, baudrate: int = 38400):
         
         # Set slave address.
         self.slave_address = slave_address
 
         # Open serial connection.
-        try: self.serial_connection = self._open_serial_connection(port=com_port, timeout=timeout)
+        try: self.serial_connection = self._open_serial_connection(port=com_port, baudrate=baudrate, timeout=timeout)
         except Exception as e: raise e
 
-    def read_holding_registers(self, slave_address: wf_types.uint_8, starting_address: wf_types.uint_16, register_quantity: wf_types.uint_16, response_length: int, verbose: bool = False) -> tuple[list[int], list[int]]:
+    def read_holding_registers(self, slave_address: wf_types.uint_8, starting_address: wf_types.uint_16, register_quantity: wf_types.uint_16, response_length: int | None = None, verbose: bool = False) -> tuple[bytes, bytes]:
         """
         Read holding registers using Modbus RTU Function Code 0x03.
         
@@ -26,11 +55,11 @@ class Modbus:
             slave_address: Modbus slave device address (0-255)
             starting_address: Address of the first register to read (0-65535)
             register_quantity: Number of registers to read (1-125)
-            response_length: Expected length of the response packet
+            response_length: Expected length of the response packet. Defaults to register_quantity * 2 + 5 (header, data and CRC)
             verbose: Enable debug output
             
         Returns:
-            tuple[list[int], list[int]]: Command packet and response packet from the device
+            tuple[bytes, bytes]: Command packet and response packet from the device
             
         Raises:
             TypeError: If any parameter is not the correct type or range
@@ -40,6 +69,7 @@ class Modbus:
         if not TypeCheck.is_uint8(slave_address): raise TypeError("slave_address must be an unsigned 8-bit integer (0-255).")
         if not TypeCheck.is_uint16(starting_address): raise TypeError("starting_address must be an unsigned 16-bit integer (0-65535).")
         if not TypeCheck.is_uint16(register_quantity): raise TypeError("register_quantity must be an unsigned 16-bit integer (0-65535).")
+        if response_length is None: response_length = Modbus.read_response_length(register_quantity)  # Read exactly the frame, no waiting on the timeout.
         if not TypeCheck.is_uint8(response_length): raise TypeError("response_length must be an unsigned 8-bit integer (0-255).")
         if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean value (True or False).")
 
@@ -59,8 +89,8 @@ class Modbus:
         crc = Modbus.calculate_modbus_crc(packet)
         packet.extend(crc)
 
-        # Convert packet to list of integers for transmission.
-        command_packet = list(packet)
+        # Freeze the packet for transmission.
+        command_packet = bytes(packet)
         
         # Send packet and receive response.
         response_packet = self._send_and_receive_packet(command_packet=command_packet, response_length=response_length, verbose=verbose)
@@ -68,7 +98,7 @@ class Modbus:
         # Return packets.
         return command_packet, response_packet
 
-    def read_input_registers(self, slave_address: wf_types.uint_8, starting_address: wf_types.uint_16, register_quantity: wf_types.uint_16, response_length: int, verbose: bool = False) -> tuple[list[int], list[int]]:
+    def read_input_registers(self, slave_address: wf_types.uint_8, starting_address: wf_types.uint_16, register_quantity: wf_types.uint_16, response_length: int | None = None, verbose: bool = False) -> tuple[bytes, bytes]:
         """
         Read input registers using Modbus RTU Function Code 0x04.
         
@@ -76,11 +106,11 @@ class Modbus:
             slave_address: Modbus slave device address (0-255)
             starting_address: Address of the first register to read (0-65535)
             register_quantity: Number of registers to read (1-125)
-            response_length: Expected length of the response packet
+            response_length: Expected length of the response packet. Defaults to register_quantity * 2 + 5 (header, data and CRC)
             verbose: Enable debug output
             
         Returns:
-            tuple[list[int], list[int]]: Command packet and response packet from the device
+            tuple[bytes, bytes]: Command packet and response packet from the device
             
         Raises:
             TypeError: If any parameter is not the correct type or range
@@ -90,6 +120,7 @@ class Modbus:
         if not TypeCheck.is_uint8(slave_address): raise TypeError("slave_address must be an unsigned 8-bit integer (0-255).")
         if not TypeCheck.is_uint16(starting_address): raise TypeError("starting_address must be an unsigned 16-bit integer (0-65535).")
         if not TypeCheck.is_uint16(register_quantity): raise TypeError("register_quantity must be an unsigned 16-bit integer (0-65535).")
+        if response_length is None: response_length = Modbus.read_response_length(register_quantity)  # Read exactly the frame, no waiting on the timeout.
         if not TypeCheck.is_uint8(response_length): raise TypeError("response_length must be an unsigned 8-bit integer (0-255).")
         if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean value (True or False).")
 
@@ -109,8 +140,8 @@ class Modbus:
         crc = Modbus.calculate_modbus_crc(packet)
         packet.extend(crc)
 
-        # Convert packet to list of integers for transmission.
-        command_packet = list(packet)
+        # Freeze the packet for transmission.
+        command_packet = bytes(packet)
         
         # Send packet and receive response.
         response_packet = self._send_and_receive_packet(command_packet=command_packet, response_length=response_length, verbose=verbose)
@@ -118,7 +149,58 @@ class Modbus:
         # Return packets.
         return command_packet, response_packet
 
-    def write_single_register(self, slave_address: wf_types.uint_8, register_address: wf_types.uint_16, register_value: wf_types.uint_16, response_length: int, verbose: bool = False) -> list[int]:
+    def read_input_registers_into(self, slave_address: wf_types.uint_8, starting_address: wf_types.uint_16, register_quantity: wf_types.uint_16, buffer: bytearray | memoryview, verbose: bool = False) -> tuple[bytes, int]:
+        """
+        Read input registers using Modbus RTU Function Code 0x04, receiving the response into a caller-owned buffer.
+        
+        Args:
+            slave_address: Modbus slave device address (0-255)
+            starting_address: Address of the first register to read (0-65535)
+            register_quantity: Number of registers to read (1-125)
+            buffer: Writable buffer sized to the expected length of the response packet
+            verbose: Enable debug output
+            
+        Returns:
+            tuple[bytes, int]: Command packet and the number of response bytes written into buffer
+            
+        Raises:
+            TypeError: If any parameter is not the correct type or range
+        """
+        
+        # Validate parameters.
+        if not TypeCheck.is_uint8(slave_address): raise TypeError("slave_address must be an unsigned 8-bit integer (0-255).")
+        if not TypeCheck.is_uint16(starting_address): raise TypeError("starting_address must be an unsigned 16-bit integer (0-65535).")
+        if not TypeCheck.is_uint16(register_quantity): raise TypeError("register_quantity must be an unsigned 16-bit integer (0-65535).")
+        if not TypeCheck.is_byte_buffer(buffer): raise TypeError("buffer must be a writable bytearray or memoryview.")
+        if not TypeCheck.is_uint8(len(buffer)): raise TypeError("buffer length must fit an unsigned 8-bit integer (0-255).")
+        if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean value (True or False).")
+
+        # Function code to read input registers.
+        function_code = 0x04
+
+        # Build the packet without CRC.
+        packet = bytearray()
+        packet.append(slave_address)
+        packet.append(function_code)
+        packet.append((starting_address >> 8) & 0xFF)  # High byte of starting address
+        packet.append(starting_address & 0xFF)         # Low byte of starting address
+        packet.append((register_quantity >> 8) & 0xFF) # High byte of register quantity
+        packet.append(register_quantity & 0xFF)        # Low byte of register quantity
+        
+        # Calculate and append CRC.
+        crc = Modbus.calculate_modbus_crc(packet)
+        packet.extend(crc)
+
+        # Freeze the packet for transmission.
+        command_packet = bytes(packet)
+        
+        # Send packet and receive response directly into the buffer.
+        received = self._send_and_receive_packet_into(command_packet=command_packet, buffer=buffer, verbose=verbose)
+
+        # Return packet and received byte count.
+        return command_packet, received
+
+    def write_single_register(self, slave_address: wf_types.uint_8, register_address: wf_types.uint_16, register_value: wf_types.uint_16, response_length: int, verbose: bool = False) -> tuple[bytes, bytes]:
         """
         Write a single register using Modbus RTU Function Code 0x06.
         
@@ -130,7 +212,7 @@ class Modbus:
             verbose: Enable debug output
             
         Returns:
-            list[int]: Response packet from the device
+            tuple[bytes, bytes]: Command packet and response packet from the device
             
         Raises:
             TypeError: If any parameter is not the correct type or range
@@ -159,8 +241,8 @@ class Modbus:
         crc = Modbus.calculate_modbus_crc(packet)
         packet.extend(crc)
 
-        # Convert packet to list of integers for transmission.
-        command_packet = list(packet)
+        # Freeze the packet for transmission.
+        command_packet = bytes(packet)
         
         # Send packet and receive response.
         response_packet = self._send_and_receive_packet(command_packet=command_packet, response_length=response_length, verbose=verbose)
@@ -168,14 +250,14 @@ class Modbus:
         # Return packets.
         return command_packet, response_packet
 
-    def write_multiple_registers(self, slave_address: wf_types.uint_8, starting_address: wf_types.uint_16, register_quantity: wf_types.uint_16, byte_quantity: wf_types.uint_8, payload: list[int], response_length: int, verbose: bool = False) -> list[int]:
+    def write_multiple_registers(self, slave_address: wf_types.uint_8, starting_address: wf_types.uint_16, register_quantity: wf_types.uint_16, byte_quantity: wf_types.uint_8, payload: bytes | bytearray | list[int], response_length: int, verbose: bool = False) -> tuple[bytes, bytes]:
 
         # Validate parameters.
         if not TypeCheck.is_uint8(slave_address): raise TypeError("slave_address must be an unsigned 8-bit integer (0-255).")
         if not TypeCheck.is_uint16(starting_address): raise TypeError("starting_address must be an unsigned 16-bit integer (0-65535).")
         if not TypeCheck.is_uint16(register_quantity): raise TypeError("register_quantity must be an unsigned 16-bit integer (0-65535).")
         if not TypeCheck.is_uint8(byte_quantity): raise TypeError("byte_quantity must be an unsigned 8-bit integer (0-255).")
-        if not TypeCheck.is_int_list(payload): raise TypeError("payload must be a list of integers.")
+        if not (TypeCheck.is_bytes(payload) or TypeCheck.is_int_list(payload)): raise TypeError("payload must be bytes or a list of integers.")
         if not TypeCheck.is_uint8(response_length): raise TypeError("response_length must be an unsigned 8-bit integer (0-255).")
         if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean value (True or False).")
         
@@ -197,8 +279,8 @@ class Modbus:
         crc = Modbus.calculate_modbus_crc(packet)
         packet.extend(crc)
 
-        # Convert packet to list of integers for transmission.
-        command_packet = list(packet)
+        # Freeze the packet for transmission.
+        command_packet = bytes(packet)
 
         # Send packet and receive response.
         response_packet = self._send_and_receive_packet(command_packet=command_packet, response_length=response_length, verbose=verbose)
@@ -206,17 +288,70 @@ class Modbus:
         # Return packets.
         return command_packet, response_packet
 
-    def _send_and_receive_packet(self, command_packet: list[int], response_length: int, verbose: bool = False) -> list[int]:
+    def write_frame_into(self, command_packet: bytes, buffer: bytearray | memoryview, verbose: bool = False, sink: list[str] | None = None) -> int:
+        """
+        Send a complete, prebuilt RTU frame (CRC included) and read the response into a caller-owned buffer.
+
+        For hot paths that keep a frame template and only patch the changing fields and CRC (see crc16_update),
+        skipping the per-call validation and packet building of the write_* helpers. The response lands in buffer
+        instead of a new bytes object, so callers that reuse one receive buffer don't allocate per transaction.
+
+        Args:
+            command_packet: the frame to send, CRC included
+            buffer: writable buffer sized to the expected response length
+            verbose: Enable debug output
+            sink: if given, debug output lines are appended here instead of printed
+
+        Returns:
+            int: number of bytes received (less than len(buffer) on timeout)
+        """
+        return self._send_and_receive_packet_into(command_packet=command_packet, buffer=buffer, verbose=verbose, sink=sink)
+
+    def set_low_latency(self, enable: bool = True, verbose: bool = False) -> bool:
+        """
+        Set or clear the ASYNC_LOW_LATENCY flag on the serial port.
+        
+        On Linux this drops the USB-serial adapter's receive latency timer (16 ms on FTDI parts) to about 1 ms,
+        so fixed-length responses are handed to the reader as soon as they arrive.
+        
+        Args:
+            enable: True to set the flag, False to clear it
+            verbose: Enable debug output
+            
+        Returns:
+            bool: True if the flag was updated, False if the platform or driver does not support it
+            
+        Raises:
+            TypeError: If any parameter is not the correct type
+        """
+
+        # Validate parameters.
+        if not TypeCheck.is_bool(enable): raise TypeError("enable must be a boolean value (True or False).")
+        if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean value (True or False).")
+
+        # Only pyserial's POSIX backend exposes the TIOCSSERIAL low latency flag.
+        set_low_latency_mode = getattr(self.serial_connection, "set_low_latency_mode", None)
+        if set_low_latency_mode is None:
+            if verbose: Console.fancy_print("<BAD>low latency mode is not supported on this platform.</BAD>")
+            return False
+
+        # Not every driver accepts the flag (e.g. native UARTs, some CDC-ACM adapters).
+        try: set_low_latency_mode(enable)
+        except Exception as e:
+            if verbose: Console.fancy_print(f"<BAD>could not update low latency mode: {e}</BAD>")
+            return False
+
+        if verbose: Console.fancy_print(f"<GOOD>low latency mode {'enabled' if enable else 'disabled'}.</GOOD>")
+        return True
+
+    def _send_and_receive_packet(self, command_packet: bytes, response_length: int, verbose: bool = False) -> bytes:
         
         # Send command packet.
-        self.serial_connection.write(bytearray(command_packet))
+        self.serial_connection.write(command_packet)
 
         # Read response packet.
         #response = self.serial_connection.readline()  # Readline is blocking by timeout length by default.
-        response = self.serial_connection.read(response_length)  # Read fixed number of bytes.
-
-        # Convert response to list of integers.
-        response_packet = list(response)
+        response_packet = self.serial_connection.read(response_length)  # Read fixed number of bytes.
 
         # Debug output.
         if verbose:
@@ -225,6 +360,22 @@ class Modbus:
 
         return response_packet
 
+    def _send_and_receive_packet_into(self, command_packet: bytes, buffer: bytearray | memoryview, verbose: bool = False, sink: list[str] | None = None) -> int:
+        
+        # Send command packet.
+        self.serial_connection.write(command_packet)
+
+        # Read response packet into the buffer. Stops at len(buffer) bytes or on timeout.
+        received = self.serial_connection.readinto(buffer)
+
+        # Debug output.
+        if verbose:
+            emit = Console.fancy_print if sink is None else sink.append
+            emit(f"<DATA>     sent command packet: {[f'0x{b:02X}' for b in command_packet]}</DATA>")
+            emit(f"<DATA>received response packet: {[f'0x{b:02X}' for b in buffer[:received]]}</DATA>")
+
+        return received
+
     def _open_serial_connection(self, port: str, baudrate: int = 38400, timeout: float = 1.0) -> serial.Serial:
         
         try:
@@ -257,41 +408,8 @@ class Modbus:
         
         # Step 1: Initialize CRC register to 0xFFFF (all bits set to 1).
         # This is the starting value specified by the Modbus protocol.
-        crc = 0xFFFF
-        
-        # Step 2: Process each byte in the message.
-        for byte in data:
-            
-            # Step 2a: XOR the current byte with the low byte of the CRC register.
-            # This "mixes" the data byte into our running CRC calculation.
-            crc ^= byte
-            
-            # Step 2b: Process each bit of the byte (8 bits total).
-            # We shift and check bits from LSB (least significant bit) to MSB.
-            for _ in range(8):
-                
-                # Step 2c: Check if the LSB (rightmost bit) is 1.
-                # We use bitwise AND with 0x0001 to isolate the LSB.
-                # Example: 0b1010_1101 & 0b0000_0001 = 0b0000_0001 (True)
-                #          0b1010_1100 & 0b0000_0001 = 0b0000_0000 (False)
-                if crc & 0x0001:
-                    
-                    # Step 2d: If LSB is 1, shift right by 1 bit (divide by 2)
-                    # This drops the LSB off the right side.
-                    # Example: 0b1010_1101 >> 1 = 0b0101_0110
-                    crc >>= 1
-                    
-                    # Step 2e: XOR with the polynomial 0xA001.
-                    # This is the Modbus polynomial in reversed bit order.
-                    # The polynomial creates the mathematical properties that
-                    # make CRC good at detecting errors.
-                    # 0xA001 = 0b1010_0000_0000_0001.
-                    crc ^= 0xA001
-                    
-                else:
-                    # Step 2f: If LSB is 0, just shift right by 1 bit.
-                    # No polynomial XOR needed in this case.
-                    crc >>= 1
+        # Step 2: Process each byte in the message (see crc16_update).
+        crc = Modbus.crc16_update(0xFFFF, data)
         
         # Step 3: Extract the low byte and high byte from the 16-bit CRC.
         # Modbus RTU transmits CRC in LITTLE-ENDIAN format (low byte first).
@@ -310,3 +428,53 @@ class Modbus:
             Console.fancy_print(f"<DATA>CRC-16-ANSI Checksum: {[f'0x{b:02X}' for b in final_checksum]}</DATA>")
         
         return final_checksum
+
+    def crc16_update(crc: int, data: bytes | bytearray | memoryview) -> int:
+        """
+        Feed data into a running CRC-16 register and return the new register value.
+
+        Starting from 0xFFFF gives the plain Modbus CRC. Starting from the value returned for a fixed frame prefix lets
+        callers that resend the same header precompute it once and only feed the bytes that change.
+
+        Args:
+            crc: current CRC register value (0xFFFF for a new frame)
+            data: bytes to feed, in transmission order
+
+        Returns:
+            int: the updated 16-bit CRC register (append it to a frame low byte first)
+        """
+
+        # Fast path: crcmod's C extension computes the same CRC-16/MODBUS (polynomial 0xA001) in one call, continuing from crc.
+        if _crc16_modbus is not None: return _crc16_modbus(bytes(data), crc)
+
+        # The 8 shift/XOR rounds per byte are precomputed in _CRC_TABLE (see _build_crc_table),
+        # indexed by the low byte of the CRC register mixed with the data byte.
+        crc_table = _CRC_TABLE
+        for byte in data:
+            crc = (crc >> 8) ^ crc_table[(crc ^ byte) & 0xFF]
+        return crc
+
+    def verify_crc(frame: bytes | bytearray | list[int]) -> bool:
+        """
+        Check the CRC-16 at the end of a received Modbus RTU frame.
+
+        Args:
+            frame: the full frame as received, CRC included (low byte first, high byte second).
+
+        Returns:
+            bool: True if the frame is long enough to hold a CRC and the CRC matches its contents, False otherwise.
+        """
+        if len(frame) < 3: return False
+        return Modbus.calculate_modbus_crc(frame[:-2]) == bytes(frame[-2:])
+
+    def read_response_length(register_quantity: wf_types.uint_16) -> int:
+        """
+        Length of a normal FC03/FC04 response for register_quantity registers.
+
+        Args:
+            register_quantity: Number of registers requested.
+
+        Returns:
+            int: slave address + function code + byte count (3 bytes), 2 bytes per register, CRC (2 bytes).
+        """
+        return register_quantity * 2 + 5
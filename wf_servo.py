@@ -1,41 +1,218 @@
 # region: Imports----------------------------------------------------------------------------------------------------------------
-from unittest import case
 from wf_modbus import Modbus
 from wf_types import TypeCheck, Parse
 from wf_console import Console
+from typing import Callable, Final
 import wf_types
+import struct
 import time
 
 # endregion
 
+# region: Constants--------------------------------------------------------------------------------------------------------------
+class _Register:
+    """Register addresses used by the servo (MKS SERVO42D RS485 User Manual V1.0.6, Part 8)."""
+    ENCODER_VALUE: Final = 0x0031              # FC04, int48 encoder value (addition).
+    EN_PIN_STATUS: Final = 0x003A              # FC04, EN pin status.
+    SHAFT_PROTECTION_STATUS: Final = 0x003E    # FC04, motor shaft protection status.
+    RESTART: Final = 0x0041                    # FC06, restart the controller.
+    CALIBRATE: Final = 0x0080                  # FC06, calibrate the encoder.
+    WORK_MODE: Final = 0x0082                  # FC06, work mode.
+    WORKING_CURRENT: Final = 0x0083            # FC06, working current (mA).
+    MICROSTEPS: Final = 0x0084                 # FC06, microsteps per step.
+    EN_PIN_MODE: Final = 0x0085                # FC06, EN pin active level.
+    SHAFT_PROTECTION: Final = 0x0088           # FC06, motor shaft locked-rotor protection.
+    SET_ZERO: Final = 0x0092                   # FC06, set current axis to zero.
+    HOLD_CURRENT: Final = 0x009B               # FC06, holding current percentage.
+    MOTOR_STATUS: Final = 0x00F1               # FC04, motor status (wf_types.Status).
+    SERIAL_MOTOR_ENABLE: Final = 0x00F3        # FC06, serial mode motor enable.
+    MOVE_AT_SPEED: Final = 0x00F6              # FC10, run the motor in speed mode.
+    MOVE_RELATIVE_PULSES: Final = 0x00FD       # FC10, position mode 1 relative motion by pulses.
+    CONFIG_PARAMETERS: Final = 0x1147          # FC04, read all configuration parameters.
+    CONFIG_PARAMETERS_COUNT: Final = 0x0013    # 19 registers in the configuration parameter block.
+    STATUS_PARAMETERS: Final = 0x1248          # FC04, read all status parameters.
+    STATUS_PARAMETERS_COUNT: Final = 0x000E    # 14 registers in the status parameter block.
+
+class _ConfigByte:
+    """Byte positions in the configuration parameter block, numbered as in the read_all_config_parameters decoder (data[4] is the first data byte)."""
+    MODE: Final = 4                            # Work mode (same values as register 0x0082).
+    HOLD_CURRENT: Final = 5                    # Holding current percentage (0x009B).
+    WORKING_CURRENT_HI: Final = 6              # Working current in mA, high byte (0x0083).
+    WORKING_CURRENT_LO: Final = 7              # Working current in mA, low byte.
+    MICROSTEPS: Final = 8                      # Microsteps per step (0x0084).
+    EN_PIN_MODE: Final = 9                     # EN pin active level (0x0085).
+    STALL_PROTECTION: Final = 12               # Shaft locked-rotor protection (0x0088).
+
+class _ResponseLength:
+    """Expected response packet lengths in bytes, including header and CRC."""
+    WRITE: Final = 8                           # FC06 echo and FC10 acknowledgement.
+    READ_SINGLE_REGISTER: Final = 7            # FC04 with 1 register.
+    ENCODER_VALUE: Final = 11                  # FC04 with 3 registers.
+    CONFIG_PARAMETERS: Final = 43              # FC04 with 19 registers (38 data bytes + 5 header/CRC).
+    STATUS_PARAMETERS: Final = 33              # FC04 with 14 registers (28 data bytes + 5 header/CRC).
+
+# endregion
+
 class Servo42dModbus:
 
     # region: Class attributes---------------------------------------------------------------------------------------------------
+    __slots__ = ('com_port', 'modbus', 'configuration', '_slave_address', '_move_echo_prefix', '_cfg_read_header', '_cache_configuration', '_config_dirty', '_config_buffer', '_status_reply_header', '_speed_echo_prefix', 'last_setup_errors', '_reg_cache', '_rx_view', '_poll_interval', '_status_cache', '_move_frame', '_speed_frame', '_state_read_header', '_single_write_frame', 'last_wait_failed_reads')
     com_port: str
-    slave_address: int
     modbus: Modbus
-    configuration: dict = {}
+    configuration: dict
+    last_setup_errors: list[str]
+    last_wait_failed_reads: int
+    _slave_address: int
+    _move_echo_prefix: bytes
+    _speed_echo_prefix: bytes
+    _cfg_read_header: bytes
+    _cache_configuration: bool
+    _config_dirty: bool
+    _config_buffer: bytearray
+    _reg_cache: dict[int, int]
+    _rx_view: memoryview
+    _poll_interval: float
+    _status_cache: tuple[float, wf_types.Status | None]
+    _status_reply_header: bytes
+    _state_read_header: bytes
+    _move_frame: tuple[bytes, int]
+    _speed_frame: tuple[bytes, int]
+    _single_write_frame: tuple[bytes, int]
+
+    # Precompiled packet layouts, so building expected replies skips format parsing.
+    _WRITE_ECHO_FMT = struct.Struct('>BBHH')      # FC10 reply: address, function, starting address, register quantity.
+    _MOVE_STRUCT = struct.Struct('>BBHI')         # Relative move by pulses payload: direction, acceleration, speed, pulses.
+    _SPEED_STRUCT = struct.Struct('>BBH')         # Move at speed payload: direction, acceleration, speed.
+    _SINGLE_WRITE_STRUCT = struct.Struct('>HH')   # FC06 request body: register address, value.
+    _FC10_HEADER_FMT = struct.Struct('>BBHHB')    # FC10 request header: address, function, starting address, register quantity, byte count.
+    _STATE_STRUCT = struct.Struct('>BB6shi6siBBBx') # Status parameter block data: status, IO, encoder (int48), speed, pulses, raw encoder (int48), error, EN, zero, protection, null.
+
+    # Status byte of the single register status reads (EN pin, shaft protection). Any other value is an invalid reply.
+    _STATUS_MAP: Final = {0x00: False, 0x01: True}
+
+    # Motor status byte to wf_types.Status. Status values are dense from 0, so a tuple index replaces Status(value); bytes past the end are invalid replies.
+    _STATUS_LUT: Final = tuple(wf_types.Status(value) for value in range(len(wf_types.Status)))
+
+    # Parameter block fields and the documented single register that writes each of them, as (byte positions, register).
+    _CONFIG_REGISTERS: Final = (
+        ((_ConfigByte.MODE,), _Register.WORK_MODE),
+        ((_ConfigByte.HOLD_CURRENT,), _Register.HOLD_CURRENT),
+        ((_ConfigByte.WORKING_CURRENT_HI, _ConfigByte.WORKING_CURRENT_LO), _Register.WORKING_CURRENT),
+        ((_ConfigByte.MICROSTEPS,), _Register.MICROSTEPS),
+        ((_ConfigByte.EN_PIN_MODE,), _Register.EN_PIN_MODE),
+        ((_ConfigByte.STALL_PROTECTION,), _Register.SHAFT_PROTECTION),
+    )
+
+    # Baud rates the controller supports (UartBaud, MKS SERVO42D RS485 User Manual V1.0.6, Part 3).
+    _BAUD_RATES: Final = (9600, 19200, 25000, 38400, 57600, 115200, 256000)
     # endregion
 
     # region: Initialization-----------------------------------------------------------------------------------------------------
-    def __init__(self, com_port: str, slave_address: wf_types.uint_8 = 1, microsteps_per_step: wf_types.uint_8 = 16, steps_per_revolution: wf_types.uint_8 = 200) -> None:
+    def __init__(self, com_port: str, slave_address: wf_types.uint_8 = 1, microsteps_per_step: wf_types.uint_8 = 16, steps_per_revolution: wf_types.uint_8 = 200, cache_configuration: bool = False, low_latency: bool = True, baudrate: int = 38400, timeout: float | None = None) -> None:
 
         # Type check parameters.
         if not TypeCheck.is_str(com_port): raise TypeError("com_port must be a string.")
         if not TypeCheck.is_uint8(slave_address): raise TypeError("slave_address must be an unsigned 8-bit integer (0-255).")
         if not TypeCheck.is_uint8(microsteps_per_step): raise TypeError("microsteps_per_step must be a valid uint_8.")
         if not TypeCheck.is_uint8(steps_per_revolution): raise TypeError("steps_per_revolution must be a valid uint_8.")
+        if not TypeCheck.is_bool(cache_configuration): raise TypeError("cache_configuration must be a boolean.")
+        if not TypeCheck.is_bool(low_latency): raise TypeError("low_latency must be a boolean.")
+        if baudrate not in self._BAUD_RATES: raise ValueError(f"baudrate must be one of {self._BAUD_RATES}.")
+        if timeout is not None and not TypeCheck.is_number(timeout): raise TypeError("timeout must be a number or None.")
+        if timeout is not None and timeout <= 0: raise ValueError("timeout must be positive.")
 
         # Set class attributes.
         self.com_port = com_port
         self.slave_address = slave_address
+        self.configuration = {}
+        self.last_setup_errors = []
+        self.last_wait_failed_reads = 0
+
+        # Configuration read caching. Opt-in, since settings changed from the controller's screen are not seen by the cache.
+        self._cache_configuration = cache_configuration
+        self._config_dirty = True
+
+        # Preallocated receive buffer for the configuration read. Byte 0 is padding so that indices match the parameter table.
+        self._config_buffer = bytearray(1 + _ResponseLength.CONFIG_PARAMETERS)
+
+        # Shared receive buffer for the short register reads (status, encoder, state block) and the write echoes, sliced per transaction so polling and motion loops don't allocate response objects.
+        self._rx_view = memoryview(bytearray(256))
 
+        # Last motor status read and when (time.monotonic()), for read_motor_status(max_age=...).
+        self._status_cache = (0.0, None)
 
-        # Create a Modbus instance.
-        self.modbus = Modbus(slave_address=self.slave_address, com_port=self.com_port)
+        # Create a Modbus instance. The baud rate must match the controller's UartBaud setting (menu, or register 0x008A); the factory default is 38400.
+        self.modbus = Modbus(slave_address=self.slave_address, com_port=self.com_port, timeout=1.0 if timeout is None else timeout, baudrate=baudrate)
+
+        # Shortest status poll interval: four character times on the wire (start + data + parity + stop bits), about 1 ms at 38400 baud 8N1.
+        connection = self.modbus.serial_connection
+        character_bits = 1 + connection.bytesize + connection.stopbits + (connection.parity != 'N')
+        self._poll_interval = max(0.001, 4 * character_bits / connection.baudrate)
+
+        # Default read timeout: 50 character times, but no less than 100 ms, which leaves room for the controller's reply delay.
+        # A lost or garbled reply then costs about a tenth of the previous fixed 1 s. Pass timeout to override.
+        if timeout is None: connection.timeout = max(0.1, 50 * character_bits / connection.baudrate)
+
+        # USB-serial low latency mode (ASYNC_LOW_LATENCY), on by default since the adapter's 16 ms latency timer dominates every round-trip.
+        # Best effort: ports or platforms that don't support it (or lack permission) keep their defaults. Pass low_latency=False to leave the port untouched.
+        if low_latency: self.set_low_latency(enable=True, verbose=False)
 
         self.set_step_parameters(microsteps=microsteps_per_step, steps_per_revolution=steps_per_revolution, verbose=False)
 
+    @property
+    def slave_address(self) -> int:
+        """Modbus slave address of the servo."""
+        return self._slave_address
+
+    @slave_address.setter
+    def slave_address(self, slave_address: wf_types.uint_8) -> None:
+
+        # Type check parameter.
+        if not TypeCheck.is_uint8(slave_address): raise TypeError("slave_address must be an unsigned 8-bit integer (0-255).")
+
+        self._slave_address = slave_address
+
+        # Rebuild the address-dependent response prefixes used to verify replies.
+        self._move_echo_prefix = self._WRITE_ECHO_FMT.pack(slave_address, 0x10, _Register.MOVE_RELATIVE_PULSES, 0x04)  # Relative move by pulses echo.
+        self._speed_echo_prefix = self._WRITE_ECHO_FMT.pack(slave_address, 0x10, _Register.MOVE_AT_SPEED, 0x02)        # Move at speed echo.
+        self._status_reply_header = bytes((slave_address, 0x04, 0x02, 0x00))                                        # Single status register reply, up to the status byte.
+        self._cfg_read_header = bytes((slave_address, 0x04, 0x26))                                                    # Read all config parameters header.
+        self._state_read_header = bytes((slave_address, 0x04, 0x1C))                                                  # Read all status parameters header.
+        self._reg_cache = {}                                                                                          # Register values belong to the previous address.
+
+        # Motion frame templates: the fixed FC10 header and the CRC register after it, so a move only packs its payload and finishes the CRC.
+        move_header = self._FC10_HEADER_FMT.pack(slave_address, 0x10, _Register.MOVE_RELATIVE_PULSES, 0x04, 0x08)
+        speed_header = self._FC10_HEADER_FMT.pack(slave_address, 0x10, _Register.MOVE_AT_SPEED, 0x02, 0x04)
+        self._move_frame = (move_header, Modbus.crc16_update(0xFFFF, move_header))
+        self._speed_frame = (speed_header, Modbus.crc16_update(0xFFFF, speed_header))
+        single_write_header = bytes((slave_address, 0x06))
+        self._single_write_frame = (single_write_header, Modbus.crc16_update(0xFFFF, single_write_header))
+
+    def close(self) -> None:
+        """Close the serial port. The servo object cannot be used afterwards."""
+        self.modbus.serial_connection.close()
+
+    def flush_input(self) -> None:
+        """Discard unread input on the serial port, e.g. a late reply to an earlier request that timed out."""
+        self.modbus.serial_connection.reset_input_buffer()
+
+    def __enter__(self) -> "Servo42dModbus":
+        """
+        #### Description:
+        Use the servo in a with-block; the serial port is closed when the block ends, as with a pyserial port (and `async with` on Servo42dModbusAsync).
+
+        #### Example:
+            with Servo42dModbus("COM4") as servo:
+                servo.read_encoder_value()
+
+        #### Last Revision:
+            2026-10-15 07:30 PM ET, Weston Forbes
+        """
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
     # endregion
 
     # region: Functions that are complete, commented, parameter sanitized and rock-solid-----------------------------------------
@@ -57,39 +234,43 @@ class Servo42dModbus:
         
         #### Raises:
             TypeError: If verbose parameter is not a boolean.
-            RuntimeError: If reading encoder value fails.
+            RuntimeError: If reading encoder value fails, or the reply is short or fails the CRC check.
         
         #### Documentation:
             MKS SERVO42D RS485 User Manual V1.0.6, Section 8.1.2, Page 55.
 
         #### Last Revision:
-            2025-11-04 11:15 AM ET, Weston Forbes
+            2026-10-15 08:00 PM ET, Weston Forbes
         """
 
         # Type check parameter.
         if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
 
-        # Create a empty response list.
-        response = []
-
         # Try protect...
         try:
 
             # Get the encoder reading.
-            command, response = self.modbus.read_input_registers(
+            command, received = self.modbus.read_input_registers_into(
                 slave_address = self.slave_address,
-                starting_address = 0x0031,
+                starting_address = _Register.ENCODER_VALUE,
                 register_quantity = 0x0003,
-                response_length = 11,
+                buffer = self._rx_view[:_ResponseLength.ENCODER_VALUE],
                 verbose = verbose
             )
+            response = self._rx_view[:received]
 
         except Exception as e:
             if verbose: Console.fancy_print(f"<BAD>failed to read encoder value from servo: {e}</BAD>")
             raise RuntimeError(f"failed to read encoder value from servo: {e}")
 
+        # Ensure the full packet arrived intact. Expected: [Slave, 0x04, 0x06, 6 data bytes, CRC]
+        if received != _ResponseLength.ENCODER_VALUE or not Modbus.verify_crc(response):
+            response_hex = response.hex(' ').upper()
+            if verbose: Console.fancy_print(f"<BAD>failed to read encoder value from servo. Invalid response: {response_hex}</BAD>")
+            raise RuntimeError(f"failed to read encoder value from servo. Invalid response: {response_hex}")
+
         # Convert response to int48 (signed).
-        encoder_count = Parse.parse_int48(response[3], response[4], response[5], response[6], response[7], response[8])
+        encoder_count = Parse.parse_int48(response[3:9])
 
         # There are 16384 units per 360 degrees (0x4000).
         # Split into rotations and degrees.
@@ -127,49 +308,38 @@ class Servo42dModbus:
             MKS SERVO42D RS485 User Manual V1.0.6, Section 8.3.3.1, Page 77.
 
         #### Last Revision:
-            2025-11-04 11:31 AM ET, Weston Forbes
+            2026-10-15 07:50 PM ET, Weston Forbes
         """
 
         if verbose: Console.fancy_print("<INFO>sending move at speed command...</INFO>")
 
-        # Type check parameters.
-        if not TypeCheck.is_enum(direction, wf_types.Direction): raise TypeError("direction must be a valid Direction enum.")
-        if not TypeCheck.is_uint8(acceleration): raise TypeError("acceleration must be an unsigned 8-bit integer (0-255).")
-        if not TypeCheck.is_uint16(speed): raise TypeError("speed must be an unsigned 16-bit integer (0-65535).")
-        if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
+        # Type check parameters. Inlined for the motion loops. Direction is always checked, since struct would pack any byte;
+        # python -O strips the rest (struct then rejects out-of-range acceleration, speed and pulses).
+        if direction.__class__ is not wf_types.Direction: raise TypeError("direction must be a valid Direction enum.")
+        if __debug__:
+            if acceleration.__class__ is not int or acceleration >> 8: raise TypeError("acceleration must be an unsigned 8-bit integer (0-255).")
+            if speed.__class__ is not int or speed >> 16: raise TypeError("speed must be an unsigned 16-bit integer (0-65535).")
+            if verbose.__class__ is not bool: raise TypeError("verbose must be a boolean.")
 
-        # Create a empty response list.
-        response = []
+        # Create an empty response.
+        response = b""
         
         # Try protect...
         try:
 
-            # Command the motor to move.
-            command, response = self.modbus.write_multiple_registers(
-                slave_address = self.slave_address,
-                starting_address = 0x00F6,
-                register_quantity = 0x0002,
-                byte_quantity=0x04,
-                payload = [
-                    direction.value,
-                    acceleration,
-                    (speed >> 8) & 0xFF,
-                    speed & 0xFF
-                ],
-                response_length=8,
-                verbose = verbose
-            )
+            # Command the motor to move. Registers 0x00F6 (direction, acceleration), 0x00F7 (speed), big endian, on the prebuilt FC10 header.
+            header, crc = self._speed_frame
+            payload = self._SPEED_STRUCT.pack(direction, acceleration, speed)
+            received = self.modbus.write_frame_into(header + payload + Modbus.crc16_update(crc, payload).to_bytes(2, 'little'), self._rx_view[:_ResponseLength.WRITE], verbose)
+            response = self._rx_view[:received]
 
         # Catch exceptions.
         except Exception as e:
             if verbose: Console.fancy_print(f"<BAD>exception occurred while sending move at speed command: {e}</BAD>")
             raise RuntimeError(f"exception occurred while sending move at speed command: {e}")
 
-        # Calculate expected response for verification.
-        expected_response = Modbus.calculate_modbus_crc([self.slave_address, 0x10, 0x00, 0xF6, 0x00, 0x02])
-
-        # Verify response.
-        if response == expected_response:
+        # Verify response against the echo prefix cached when the slave address was set.
+        if response[:6] == self._speed_echo_prefix:
             if verbose: Console.fancy_print("<GOOD>move at speed command sent successfully.</GOOD>")
             return True
         else:
@@ -193,6 +363,7 @@ class Servo42dModbus:
 
         #### Documentation:
             MKS SERVO42D RS485 User Manual V1.0.6, Section 8.2.5, Page 60.
+            The command returns as soon as calibration starts; use wait_for_calibration() to block until it finishes.
 
         #### Last Revision:
             2025-11-04 11:37 AM ET, Weston Forbes 
@@ -203,8 +374,8 @@ class Servo42dModbus:
         # Type check parameter.
         if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
 
-        # Create a empty response list.
-        response = []
+        # Create an empty response.
+        response = b""
         
         # Try protect...
         try:
@@ -212,9 +383,9 @@ class Servo42dModbus:
             # Write to register.
             command, response = self.modbus.write_single_register(
                 slave_address = self.slave_address,
-                register_address = 0x0080,
+                register_address = _Register.CALIBRATE,
                 register_value = 0x0001,
-                response_length= 8,
+                response_length = _ResponseLength.WRITE,
                 verbose = verbose
             )
         
@@ -258,19 +429,13 @@ class Servo42dModbus:
             # Type check parameter.
             if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
 
-            # Create an empty response list.
-            response = []
+            # Assume failure until the register is confirmed.
+            written = False
             
             # Try protect...
             try:
                 # Write to register.
-                command, response = self.modbus.write_single_register(
-                    slave_address = self.slave_address,
-                    register_address = 0x0088,
-                    register_value = 0x0000,
-                    response_length= 8,
-                    verbose = verbose
-                )
+                written = self._write_if_changed(_Register.SHAFT_PROTECTION, 0x0000, verbose=verbose)
             
             # Catch exceptions.
             except Exception as e:
@@ -278,7 +443,7 @@ class Servo42dModbus:
                 raise RuntimeError(f"exception occurred while attempting to clear motor protection: {e}")
 
             # Check response. A successful write echoes the command.
-            if response == command: 
+            if written:
                 if verbose: Console.fancy_print("<GOOD>motor protection cleared successfully.</GOOD>")
                 return True
             else: 
@@ -312,19 +477,13 @@ class Servo42dModbus:
             # Type check parameter.
             if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
 
-            # Create an empty response list.
-            response = []
+            # Assume failure until the register is confirmed.
+            written = False
             
             # Try protect...
             try:
                 # Write to register (0x0085 with value 0x0002 for 'Board always active').
-                command, response = self.modbus.write_single_register(
-                    slave_address = self.slave_address,
-                    register_address = 0x0085,
-                    register_value = 0x0002, # Value 0x0002 sets board to always be active (i.e., disables the physical enable pin).
-                    response_length= 8,
-                    verbose = verbose
-                )
+                written = self._write_if_changed(_Register.EN_PIN_MODE, 0x0002, verbose=verbose)  # Value 0x0002 sets board to always be active (i.e., disables the physical enable pin).
 
             # Catch exceptions.
             except Exception as e:
@@ -332,7 +491,7 @@ class Servo42dModbus:
                 raise RuntimeError(f"exception occurred while attempting to disable enable pin: {e}")
 
             # Check response. A successful write echoes the command.
-            if response == command: 
+            if written:
                 if verbose: Console.fancy_print("<GOOD>enable pin disabled successfully.</GOOD>")
                 return True
             else: 
@@ -359,41 +518,32 @@ class Servo42dModbus:
             MKS SERVO42D RS485 User Manual V1.0.6, Section 8.1.7, Page 58.
 
         #### Last Revision:
-            2025-11-04 13:02 PM ET, Weston Forbes
+            2026-10-15 11:50 AM ET, Weston Forbes
         """
         if verbose: Console.fancy_print("<INFO>\nreading EN pin status...</INFO>")
 
         # Type check parameter.
         if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
 
-        # Read from register.
-        response = []
+        # Read from register into the shared receive buffer.
         try:
-            command, response = self.modbus.read_input_registers(
+            command, received = self.modbus.read_input_registers_into(
                 slave_address = self.slave_address,
-                starting_address = 0x003A,
+                starting_address = _Register.EN_PIN_STATUS,
                 register_quantity = 0x0001,
-                response_length = 7,
+                buffer = self._rx_view[:_ResponseLength.READ_SINGLE_REGISTER],
                 verbose = verbose
             )
+            response = self._rx_view[:received]
         except Exception as e:
             if verbose: Console.fancy_print(f"<BAD>exception occurred while reading EN pin status: {e}</BAD>")
             raise RuntimeError(f"exception occurred while reading EN pin status: {e}")
 
-        # Generate expected response packets for status verification.
-        expected_packet_enabled = bytearray([self.slave_address, 0x04, 0x02, 0x00, 0x01]) # Value 0x01 for enabled
-        expected_packet_disabled = bytearray([self.slave_address, 0x04, 0x02, 0x00, 0x00]) # Value 0x00 for disabled
-        expected_packet_enabled.extend(Modbus._calculate_modbus_crc(expected_packet_enabled))
-        expected_packet_disabled.extend(Modbus._calculate_modbus_crc(expected_packet_disabled))
-        
-        # Check response and extract en pin status.
-        response_ba = bytearray(response)
-        if response_ba == expected_packet_enabled: 
-            if verbose: Console.fancy_print("<GOOD>EN pin is enabled.</GOOD>")
-            return True
-        elif response_ba == expected_packet_disabled: 
-            if verbose: Console.fancy_print("<GOOD>EN pin is disabled.</GOOD>")
-            return False
+        # Check the frame (CRC and header), then extract en pin status from the status byte.
+        status = self._STATUS_MAP.get(response[4]) if Modbus.verify_crc(response) and response[:4] == self._status_reply_header else None
+        if status is not None:
+            if verbose: Console.fancy_print(f"<GOOD>EN pin is {'enabled' if status else 'disabled'}.</GOOD>")
+            return status
         else: 
             if verbose: Console.fancy_print("<BAD>failed to read en pin status from controller(unexpected response).</BAD>")
             raise ValueError("failed to read en pin status from servo.")
@@ -418,41 +568,32 @@ class Servo42dModbus:
             MKS SERVO42D RS485 User Manual V1.0.6, Section 8.1.9, Page 58.
 
         #### Last Revision:
-            2025-11-04 13:03 PM ET, Weston Forbes
+            2026-10-15 11:50 AM ET, Weston Forbes
         """
         if verbose: Console.fancy_print("<INFO>\nreading motor shaft protection status...</INFO>")
 
         # Type check parameter.
         if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
 
-        # Read from register.
-        response = []
+        # Read from register into the shared receive buffer.
         try:
-            command, response = self.modbus.read_input_registers(
+            command, received = self.modbus.read_input_registers_into(
                 slave_address = self.slave_address,
-                starting_address = 0x003E,
+                starting_address = _Register.SHAFT_PROTECTION_STATUS,
                 register_quantity = 0x0001,
-                response_length = 7,
+                buffer = self._rx_view[:_ResponseLength.READ_SINGLE_REGISTER],
                 verbose = verbose
             )
+            response = self._rx_view[:received]
         except Exception as e:
             if verbose: Console.fancy_print(f"<BAD>exception occurred while reading motor shaft protection status: {e}</BAD>")
             raise RuntimeError(f"exception occurred while reading motor shaft protection status: {e}")
 
-        # Generate expected response packets for status verification.
-        expected_packet_enabled = bytearray([self.slave_address, 0x04, 0x02, 0x00, 0x01]) # Value 0x01 for enabled
-        expected_packet_disabled = bytearray([self.slave_address, 0x04, 0x02, 0x00, 0x00]) # Value 0x00 for disabled
-        expected_packet_enabled.extend(Modbus.calculate_modbus_crc(expected_packet_enabled))
-        expected_packet_disabled.extend(Modbus.calculate_modbus_crc(expected_packet_disabled))
-        
-        # Check response and extract shaft protection status.
-        response_ba = bytearray(response)
-        if response_ba == expected_packet_enabled:
-            if verbose: Console.fancy_print("<GOOD>motor shaft protection is enabled.</GOOD>")
-            return True
-        elif response_ba == expected_packet_disabled:
-            if verbose: Console.fancy_print("<GOOD>motor shaft protection is disabled.</GOOD>")
-            return False
+        # Check the frame (CRC and header), then extract shaft protection status from the status byte.
+        status = self._STATUS_MAP.get(response[4]) if Modbus.verify_crc(response) and response[:4] == self._status_reply_header else None
+        if status is not None:
+            if verbose: Console.fancy_print(f"<GOOD>motor shaft protection is {'enabled' if status else 'disabled'}.</GOOD>")
+            return status
         else: 
             if verbose: Console.fancy_print("<BAD>failed to read shaft protection status from servo (unexpected response).</BAD>")
             raise ValueError("failed to read shaft protection status from servo.")
@@ -484,17 +625,17 @@ class Servo42dModbus:
         # Type check parameter.
         if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
 
-        # Create an empty response list.
-        response = []
+        # Create an empty response.
+        response = b""
         
         # Try protect...
         try:
             # Write to register (0x0041 with value 0x0001 for restart).
             command, response = self.modbus.write_single_register(
                 slave_address = self.slave_address,
-                register_address = 0x0041,
+                register_address = _Register.RESTART,
                 register_value = 0x0001,
-                response_length= 8,
+                response_length = _ResponseLength.WRITE,
                 verbose = verbose
             )
         
@@ -505,6 +646,7 @@ class Servo42dModbus:
 
         # Check response. A successful write echoes the command.
         if response == command:
+            self.invalidate_cache()
             if verbose: Console.fancy_print("<GOOD>motor restarted successfully.</GOOD>")
             return True
         else:
@@ -537,17 +679,17 @@ class Servo42dModbus:
         # Type check parameters.
         if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
 
-        # Create an empty response list.
-        response = []
+        # Create an empty response.
+        response = b""
         
         # Try protect...
         try:
             # Write to register (0x0092 with value 0x0001 for setting zero).
             command, response = self.modbus.write_single_register(
                 slave_address = self.slave_address,
-                register_address = 0x0092,
+                register_address = _Register.SET_ZERO,
                 register_value = 0x0001,
-                response_length= 8,
+                response_length = _ResponseLength.WRITE,
                 verbose = verbose
             )
         
@@ -592,19 +734,13 @@ class Servo42dModbus:
         if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
         if not TypeCheck.is_enum(work_mode, wf_types.WorkMode): raise TypeError("work_mode must be a valid WorkMode enum.")
 
-        # Create an empty response list.
-        response = []
+        # Assume failure until the register is confirmed.
+        written = False
         
         # Try protect...
         try:
             # Write to register (0x0082 with the work_mode enum value).
-            command, response = self.modbus.write_single_register(
-                slave_address = self.slave_address,
-                register_address = 0x0082,
-                register_value = work_mode.value,
-                response_length= 8,
-                verbose = verbose
-            )
+            written = self._write_if_changed(_Register.WORK_MODE, work_mode.value, verbose=verbose)
         
         # Catch exceptions.
         except Exception as e:
@@ -613,14 +749,14 @@ class Servo42dModbus:
 
 
         # Check response.
-        if response == command:
+        if written:
             if verbose: Console.fancy_print("<GOOD>work mode set successfully.</GOOD>")
             return True
         else:
             if verbose: Console.fancy_print("<BAD>failed to set work mode.</BAD>")
             return False
 
-    def set_serial_mode_motor_enable(self, enable_disable: wf_types.EnableDisable, verbose: bool = False) -> bool:
+    def set_serial_mode_motor_enable(self, enable_disable: wf_types.EnableDisable, verbose: bool = False, sink: list[str] | None = None) -> bool:
         """
         #### Description:
         Set the serial mode motor enable state for the motor.
@@ -628,53 +764,48 @@ class Servo42dModbus:
         #### Args:
             enable_disable (wf_types.EnableDisable): The enable/disable state (0x00 or 0x01) to set for the motor.
             verbose (bool, optional)
+            sink (list[str], optional): If given, output lines are appended here instead of printed, for the caller to print once. Defaults to None.
 
         #### Returns:
             bool: True if the motor enable state was set successfully, False otherwise.
 
         #### Raises:
-            TypeError: If verbose is not a boolean or enable_disable is not a valid EnableDisable enum.
+            TypeError: If verbose is not a boolean, enable_disable is not a valid EnableDisable enum, or sink is not a list.
             RuntimeError: If sending the enable/disable command fails (e.g., Modbus communication error).
 
         #### Documentation:
             MKS SERVO42D RS485 User Manual V1.0.6, Section 8.2.20, Page 67.
 
         #### Last Revision:
-            2025-11-04 13:07 PM ET, Weston Forbes
+            2026-10-15 07:40 PM ET, Weston Forbes
         """
-        if verbose: Console.fancy_print("<INFO>\nsetting serial mode motor enable...</INFO>")
+        emit = Console.fancy_print if sink is None else sink.append  # Output goes to the console, or to the caller's list.
+        if verbose: emit("<INFO>\nsetting serial mode motor enable...</INFO>")
                     
         # Type check parameter.
         if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
         if not TypeCheck.is_enum(enable_disable, wf_types.EnableDisable): raise TypeError("enable_disable must be a valid EnableDisable enum.")
+        if sink is not None and not isinstance(sink, list): raise TypeError("sink must be a list or None.")
 
-        # Create an empty response list.
-        response = []
+        # Create an empty response.
+        response = b""
         
         # Try protect...
         try:
             # Write to register (0x00F3 with the enable/disable enum value).
-            # Note: The register address and value formatting (0x00 << 8 | X) are maintained 
-            # from the original code, but 0x00F3 is equivalent to 0xF3 for the address.
-            command, response = self.modbus.write_single_register(
-                slave_address = self.slave_address,
-                register_address = 0x00 << 8 | 0xF3,
-                register_value = 0x00 << 8 | enable_disable.value,
-                response_length= 8,
-                verbose = verbose
-            )
+            command, response = self._write_single(_Register.SERIAL_MOTOR_ENABLE, enable_disable, verbose=verbose, sink=sink)
         
         # Catch exceptions.
         except Exception as e:
-            if verbose: Console.fancy_print(f"<BAD>exception occurred while attempting to set serial mode motor enable: {e}</BAD>")
+            if verbose: emit(f"<BAD>exception occurred while attempting to set serial mode motor enable: {e}</BAD>")
             raise RuntimeError(f"exception occurred while attempting to set serial mode motor enable: {e}")
 
         # Check response.
         if response == command:
-            if verbose: Console.fancy_print("<GOOD>serial mode motor enable set successfully.</GOOD>")
+            if verbose: emit("<GOOD>serial mode motor enable set successfully.</GOOD>")
             return True
         else:
-            if verbose: Console.fancy_print("<BAD>failed to set serial mode motor enable.</BAD>")
+            if verbose: emit("<BAD>failed to set serial mode motor enable.</BAD>")
             return False
 
     def set_holding_current_percentage(self, holding_current_percentage: wf_types.HoldCurrentPercentage, verbose: bool = False) -> bool:
@@ -705,19 +836,13 @@ class Servo42dModbus:
         if not TypeCheck.is_enum(holding_current_percentage, wf_types.HoldCurrentPercentage): raise TypeError("holding_current_percentage must be a valid HoldCurrentPercentage enum.")
         if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
 
-        # Create an empty response list.
-        response = []
+        # Assume failure until the register is confirmed.
+        written = False
         
         # Try protect...
         try:
             # Write to register (0x009B with the holding_current_percentage enum value).
-            command, response = self.modbus.write_single_register(
-                slave_address = self.slave_address,
-                register_address = 0x009B,
-                register_value = holding_current_percentage.value,
-                response_length= 8,
-                verbose = verbose
-            )
+            written = self._write_if_changed(_Register.HOLD_CURRENT, holding_current_percentage.value, verbose=verbose)
         
         # Catch exceptions.
         except Exception as e:
@@ -725,7 +850,7 @@ class Servo42dModbus:
             raise RuntimeError(f"exception occurred while attempting to set holding current percentage: {e}")
 
         # Check response.
-        if response == command:
+        if written:
             if verbose: Console.fancy_print("<GOOD>holding current percentage set successfully.</GOOD>")
             return True
         else:
@@ -762,19 +887,13 @@ class Servo42dModbus:
         if not TypeCheck.is_uint8(steps_per_revolution): raise TypeError("steps_per_revolution must be a valid uint_8.")
         if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
 
-        # Create an empty response list.
-        response = []
+        # Assume failure until the register is confirmed.
+        written = False
 
         # Try protect...
         try:
             # Write microsteps value to register 0x0084.
-            command, response = self.modbus.write_single_register(
-                slave_address = self.slave_address,
-                register_address = 0x0084,
-                register_value = microsteps,
-                response_length = 8,
-                verbose = verbose
-            )
+            written = self._write_if_changed(_Register.MICROSTEPS, microsteps, verbose=verbose)
         
         # Catch exceptions.
         except Exception as e:
@@ -782,16 +901,20 @@ class Servo42dModbus:
             raise RuntimeError(f"exception occurred while attempting to set step parameters: {e}")
 
         # Check response.
-        if response == command: 
-            self.configuration["microsteps_per_step"] = microsteps
-            self.configuration["steps_per_revolution"] = steps_per_revolution
-            self.configuration["degrees_per_microstep"] = 360.0 / (microsteps * steps_per_revolution)
+        if written:
+            self._store_step_parameters(microsteps, steps_per_revolution)
             if verbose: Console.fancy_print("<GOOD>step parameters set successfully.</GOOD>")
             return True
         else:
             if verbose: Console.fancy_print("<BAD>failed to set step parameters.</BAD>")
             return False
 
+    def _store_step_parameters(self, microsteps: wf_types.uint_16, steps_per_revolution: wf_types.uint_8) -> None:
+        """Record the step parameters the controller was configured with, for use by the degree-based moves."""
+        self.configuration["microsteps_per_step"] = microsteps
+        self.configuration["steps_per_revolution"] = steps_per_revolution
+        self.configuration["degrees_per_microstep"] = 360.0 / (microsteps * steps_per_revolution)
+
     def set_working_current(self, working_current_ma: wf_types.uint_16, verbose: bool = False) -> bool:
         """
         #### Description:
@@ -825,19 +948,13 @@ class Servo42dModbus:
         if working_current_ma < 250 or working_current_ma > 3000:
             raise ValueError("working_current must be between 250 and 3000 mA.")
 
-        # Create an empty response list.
-        response = []
+        # Assume failure until the register is confirmed.
+        written = False
 
         # Try protect...
         try:
             # Write current value to register 0x0083.
-            command, response = self.modbus.write_single_register(
-                slave_address = self.slave_address,
-                register_address = 0x0083,
-                register_value = working_current_ma,
-                response_length = 8,
-                verbose = verbose
-            )
+            written = self._write_if_changed(_Register.WORKING_CURRENT, working_current_ma, verbose=verbose)
         
         # Catch exceptions.
         except Exception as e:
@@ -846,14 +963,14 @@ class Servo42dModbus:
 
 
         # Check response.
-        if response == command:
+        if written:
             if verbose: Console.fancy_print("<GOOD>working current set successfully.</GOOD>")
             return True
         else:
             if verbose: Console.fancy_print("<BAD>failed to set working current.</BAD>")
             return False
 
-    def setup_routine(self, verbose: bool = True) -> bool:
+    def setup_routine(self, verbose: bool = True, strict: bool = True) -> bool:
         """
         #### Description:
         This routine executes a series of configuration commands to bring the motor controller to a known baseline state, enabling proper operation with the Modbus library.
@@ -866,101 +983,148 @@ class Servo42dModbus:
 
         #### Function Calls:
         The routine performs the following internal configuration calls:
-        * `disable_enable_pin()`
-        * `set_work_mode(SR_CLOSE)`
+        * `_write_config_fields()`, one read of the parameter block, then a single-register write for each of these settings the controller does not already hold:
+            * EN pin always active (as `disable_enable_pin()`)
+            * work mode SR_CLOSE (as `set_work_mode(SR_CLOSE)`)
+            * shaft protection off (as `clear_motor_protection()`)
+            * working current 1000 mA (as `set_working_current(1000 mA)`)
+            * holding current PERCENT_50 (as `set_holding_current_percentage(PERCENT_50)`)
+            * 16 microsteps per step, 200 steps per revolution (as `set_step_parameters(microsteps=16, steps_per_revolution=200)`)
         * `set_serial_mode_motor_enable(ENABLE)`
-        * `clear_motor_protection()`
-        * `set_working_current(1000 mA)`
-        * `set_holding_current_percentage(PERCENT_50)`
-        * `set_step_parameters(microsteps=16, steps_per_revolution=200)`
         * `read_all_config_parameters()`
 
         #### Args:
-            verbose (bool, optional)
+            verbose (bool, optional): Passed on to each configuration call. Their output is collected and printed in one go once the routine is done, so nothing is printed between requests. Defaults to True.
+            strict (bool, optional): If True, stop at the first step that reports failure instead of running the remaining steps. Defaults to True.
 
         #### Returns:
-            bool: True if the setup routine completes without raising an exception, False otherwise (though individual failures are handled by called methods).
+            bool: True if every step reported success, False otherwise. The names of the failed steps are kept in `last_setup_errors`.
 
         #### Raises:
-            TypeError: If verbose is not a boolean. 
+            TypeError: If verbose or strict is not a boolean. 
             RuntimeError: If any critical configuration step fails due to an unhandled exception during the routine execution.
 
         #### Last Revision:
-            2025-11-04 13:14 PM ET, Weston Forbes
+            2026-10-15 07:40 PM ET, Weston Forbes
         """
         if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
+        if not TypeCheck.is_bool(strict): raise TypeError("strict must be a boolean.")
 
-        if verbose: Console.fancy_print("\n<INFO>Running servo setup routine to establish known state...</INFO>")
+        fancy_print = Console.fancy_print  # Looked up once for the routine.
+        if verbose: fancy_print("\n<INFO>Running servo setup routine to establish known state...</INFO>")
         
+        def write_configuration_parameters(lines: list[str]) -> bool:
+            # The register settings are compared against one read of the parameter block; only the changed ones are written.
+            written = self._write_config_fields({
+                _ConfigByte.EN_PIN_MODE: 0x02,                                           # Board always active (EN pin disabled).
+                _ConfigByte.MODE: wf_types.WorkMode.SR_CLOSE.value,
+                _ConfigByte.STALL_PROTECTION: 0x00,
+                _ConfigByte.WORKING_CURRENT_HI: (1000 >> 8) & 0xFF,                      # 1000 mA.
+                _ConfigByte.WORKING_CURRENT_LO: 1000 & 0xFF,
+                _ConfigByte.HOLD_CURRENT: wf_types.HoldCurrentPercentage.PERCENT_50.value,
+                _ConfigByte.MICROSTEPS: 16,
+            }, verbose=verbose, sink=lines)
+            if written:
+                self._store_step_parameters(microsteps=16, steps_per_revolution=200)
+                lines.append("<DATA>EN pin always active, work mode SR_CLOSE, shaft protection off, 1000 mA, hold current 50%, 16 microsteps per step.</DATA>")
+            return written
+
+        def read_configuration_parameters(lines: list[str]) -> bool:
+            return bool(self.read_all_config_parameters(verbose=verbose, sink=lines))
+
+        # Configuration steps, in order, as (name, step) pairs. Each step takes the output lines and returns True on success.
+        steps = (
+            ("write configuration parameters", write_configuration_parameters),
+            ("serial mode motor enable", lambda lines: self.set_serial_mode_motor_enable(wf_types.EnableDisable.ENABLE, verbose=verbose, sink=lines)),
+            ("read configuration parameters", read_configuration_parameters),
+        )
+        self.last_setup_errors = []
+        step_name = ""
+
+        # Step output (the configuration calls' own included) is collected here and printed once the bus traffic is done, so terminal writes don't sit between requests.
+        lines = []
+
         try:
-            # Execute configuration steps
-            self.disable_enable_pin(verbose=True)
-            self.set_work_mode(wf_types.WorkMode.SR_CLOSE, verbose=True)
-            self.set_serial_mode_motor_enable(wf_types.EnableDisable.ENABLE, verbose=True)
-            self.clear_motor_protection(verbose=True)
-            self.set_working_current(working_current_ma = 1000, verbose = True)
-            self.set_holding_current_percentage(wf_types.HoldCurrentPercentage.PERCENT_50, verbose=True)
-            self.set_step_parameters(microsteps=16, steps_per_revolution=200, verbose=True)
-            self.read_all_config_parameters(verbose=True)
-            
-            if verbose: Console.fancy_print("<GOOD>Setup routine completed successfully.</GOOD>")
+
+            # Execute configuration steps.
+            for step_name, step in steps:
+                if step(lines):
+                    lines.append(f"<GOOD>{step_name}: done.</GOOD>")
+                    continue
+                lines.append(f"<BAD>{step_name}: failed.</BAD>")
+                self.last_setup_errors.append(step_name)
+                if strict: break
+
+            if self.last_setup_errors:
+                if verbose: fancy_print("\n".join(lines + [f"<BAD>Setup routine failed at: {', '.join(self.last_setup_errors)}.</BAD>"]))
+                return False
+            if verbose: fancy_print("\n".join(lines + ["<GOOD>Setup routine completed successfully.</GOOD>"]))
             return True
             
         except Exception as e:
-            if verbose: Console.fancy_print(f"<BAD>Setup routine failed: {e}</BAD>")
+            self.last_setup_errors.append(step_name)
+            if verbose: fancy_print("\n".join(lines + [f"<BAD>Setup routine failed: {e}</BAD>"]))
             # Re-raise the exception after logging, or return False if failure is acceptable.
             # Given the context of the other methods, re-raising is the safer choice for critical setup.
             raise RuntimeError(f"Setup routine failed: {e}")
 
-    def read_all_config_parameters(self, verbose: bool = False) -> dict:
+    def read_all_config_parameters(self, verbose: bool = False, sink: list[str] | None = None) -> dict:
         """
         #### Description:
         Reads all configuration parameters from controller.
+        If the servo was created with `cache_configuration=True`, the last decoded parameters are returned without a bus transaction until one of the configuration setters writes to the controller.
 
         #### Args:
             verbose (bool, optional)
+            sink (list[str], optional): If given, output lines are appended here instead of printed, for the caller to print once. Defaults to None.
 
         #### Returns:
             dict: A dictionary containing all parsed configuration parameters.
 
         #### Raises:
-            TypeError: If verbose parameter is not a boolean.
+            TypeError: If verbose is not a boolean or sink is not a list.
             RuntimeError: If reading the registers fails due to a communication error.
-            ValueError: If the response header is invalid or does not match the expected format for a read operation (e.g., incorrect slave address, function code, or byte count).
+            ValueError: If the response is short, fails the CRC check, or its header does not match the expected format for a read operation (e.g., incorrect slave address, function code, or byte count).
 
         #### Documentation:
             MKS SERVO42D RS485 User Manual V1.0.6, Section 8.3.2, Page 73 (Read parameters). Reference sections 3.2 to 5.4.5 for parameter decoding.
 
         #### Last Revision:
-            2025-11-04 13:17 PM ET, Weston Forbes
+            2026-10-15 07:40 PM ET, Weston Forbes
         """
+        emit = Console.fancy_print if sink is None else sink.append  # Output goes to the console, or to the caller's list.
 
-        if verbose: Console.fancy_print("<INFO>\nreading all configuration parameters...</INFO>")
+        if verbose: emit("<INFO>\nreading all configuration parameters...</INFO>")
 
-        # Type check parameter.
+        # Type check parameters.
         if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
+        if sink is not None and not isinstance(sink, list): raise TypeError("sink must be a list or None.")
 
-        # Read from register.
-        response = []
+        # Serve the cached configuration if caching is enabled and nothing has been written since the last read.
+        if self._cache_configuration and not self._config_dirty:
+            if verbose: emit("<GOOD>Configuration parameters served from cache.</GOOD>")
+            return self.configuration
+
+        # Read from register straight into the preallocated buffer, leaving the padding byte untouched.
+        data = memoryview(self._config_buffer)
+        received = 0
         try:
-            command, response = self.modbus.read_input_registers(
+            command, received = self.modbus.read_input_registers_into(
                 slave_address = self.slave_address,
-                starting_address = 0x1147,
-                register_quantity = 0x0013, # 19 registers * 2 bytes/reg = 38 data bytes + 5 header/CRC = 43 bytes total
-                response_length=43,
+                starting_address = _Register.CONFIG_PARAMETERS,
+                register_quantity = _Register.CONFIG_PARAMETERS_COUNT, # 19 registers * 2 bytes/reg = 38 data bytes + 5 header/CRC = 43 bytes total
+                buffer = data[1:],
                 verbose = False
             )
         except Exception as e:
-            if verbose: Console.fancy_print(f"<BAD>exception occurred while reading configuration parameters: {e}</BAD>")
+            if verbose: emit(f"<BAD>exception occurred while reading configuration parameters: {e}</BAD>")
             raise RuntimeError(f"exception occurred while reading configuration parameters: {e}")
 
         parameters = self.configuration
 
-        # Ensure the header is correct. Expected: [Slave, 0x04, 0x26 (38 decimal bytes)]
-        if response and response[0] == self.slave_address and response[1] == 0x04 and response[2] == 0x26:
-            
-            # Pad data with a leading zero to align indices with original code (response[3] is first data byte).
-            data = [0] + response 
+        # Ensure the full packet arrived, the CRC matches and the header is correct. Expected: [Slave, 0x04, 0x26 (38 decimal bytes)]
+        # data[1] is the first response byte, so data[4] is the first data byte.
+        if received == _ResponseLength.CONFIG_PARAMETERS and Modbus.verify_crc(data[1:1 + received]) and data[1:4] == self._cfg_read_header:
             
             # --- Parameter Decoding ---
             # Byte 4: Mode (Reg 0x1147)
@@ -1043,8 +1207,9 @@ class Servo42dModbus:
             parameters["group_address"] = data[17]
 
             # Byte 18-19: Response Mode (Reg 0x114E)
-            parameters["respond"] = (data[18] << 8) | data[19]
-            match parameters["respond"]:
+            respond = (data[18] << 8) | data[19]
+            parameters["respond"] = respond
+            match respond:
                 case 0: parameters["respond_enabled"] = "enabled respond"
                 case 1: parameters["respond_enabled"] = "disabled respond"
                 case 2: parameters["respond_enabled"] = "enabled active"
@@ -1129,18 +1294,28 @@ class Servo42dModbus:
                 case _: parameters["power_on_zero_direction"] = "unknown"
         
         else:
-            if verbose:
-                Console.fancy_print(f"<BAD>Failed to read config. Invalid response header: {[f'0x{b:02X}' for b in response]}</BAD>")
-            raise ValueError(f"Failed to read config. Invalid response: {[f'0x{b:02X}' for b in response]}")
+            response_hex = data[1:1 + received].hex(' ').upper()
+            if verbose: emit(f"<BAD>Failed to read config. Invalid response: {response_hex}</BAD>")
+            raise ValueError(f"Failed to read config. Invalid response: {response_hex}")
 
         if verbose:
-            Console.fancy_print("<GOOD>Configuration parameters read successfully:</GOOD>")
-            for key, value in parameters.items():
-                Console.fancy_print(f"  - {key}: {value}")
+            emit("<GOOD>Configuration parameters read successfully:</GOOD>")
+            emit("\n".join([f"  - {key}: {value}" for key, value in parameters.items()]))  # One print for the whole table.
         self.configuration = parameters
+        self._config_dirty = False
+
+        # The parameter block is the only way to read these registers back, so refresh the register cache from it.
+        self._reg_cache.update({
+            _Register.WORK_MODE: data[_ConfigByte.MODE],
+            _Register.HOLD_CURRENT: data[_ConfigByte.HOLD_CURRENT],
+            _Register.WORKING_CURRENT: (data[_ConfigByte.WORKING_CURRENT_HI] << 8) | data[_ConfigByte.WORKING_CURRENT_LO],
+            _Register.MICROSTEPS: data[_ConfigByte.MICROSTEPS],
+            _Register.EN_PIN_MODE: data[_ConfigByte.EN_PIN_MODE],
+            _Register.SHAFT_PROTECTION: data[_ConfigByte.STALL_PROTECTION],
+        })
         return parameters
 
-    def relative_move_by_degrees(self, direction: wf_types.Direction, acceleration: wf_types.uint_8, speed: wf_types.uint_16, degrees: float, verbose: bool = False) -> bool:
+    def relative_move_by_degrees(self, direction: wf_types.Direction, acceleration: wf_types.uint_8, speed: wf_types.uint_16, degrees: float, verbose: bool = False, blocking: bool = False) -> bool:
         """
         #### Description:
         Calculates the required microsteps (pulses) for a desired angular movement 
@@ -1152,9 +1327,10 @@ class Servo42dModbus:
             speed (wf_types.uint_16): The movement speed (0-65535).
             degrees (float): The angular distance to move, in degrees.
             verbose (bool, optional)
+            blocking (bool, optional): If True, wait for the motor to stop before returning (see `relative_move_by_pulses`). Defaults to False.
 
         #### Returns:
-            bool: True if the relative move command was successfully sent, False otherwise.
+            bool: True if the relative move command was successfully sent (and, when blocking, the motor stopped), False otherwise.
 
         #### Raises:
             TypeError: If any parameter is of incorrect type.
@@ -1165,10 +1341,11 @@ class Servo42dModbus:
             Composite method leveraging `set_step_parameters` output for calculation.
 
         #### Last Revision:
-            2025-11-04 13:18 PM ET, Weston Forbes
+            2026-10-15 03:25 PM ET, Weston Forbes
         """
         if not TypeCheck.is_enum(direction, wf_types.Direction): raise TypeError("direction must be a valid Direction enum.")
         if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
+        if not TypeCheck.is_bool(blocking): raise TypeError("blocking must be a boolean.")
         if not TypeCheck.is_uint8(acceleration): raise TypeError("acceleration must be an unsigned 8-bit integer (0-255).")
         if not TypeCheck.is_uint16(speed): raise TypeError("speed must be an unsigned 16-bit integer (0-65535).")
         if not TypeCheck.is_float(degrees): raise TypeError("degrees must be a float.")
@@ -1181,21 +1358,23 @@ class Servo42dModbus:
 
         # Pass the calculated microsteps to the pulses method.
         # Communication error handling is delegated to relative_move_by_pulses.
-        return self.relative_move_by_pulses(direction, acceleration, speed, microsteps, verbose)
+        return self.relative_move_by_pulses(direction, acceleration, speed, microsteps, verbose, blocking)
 
-    def relative_move_by_pulses(self, direction: wf_types.Direction, acceleration: wf_types.uint_8, speed: wf_types.uint_16, pulses: wf_types.uint_32, verbose: bool = False) -> bool:
+    def relative_move_by_pulses(self, direction: wf_types.Direction, acceleration: wf_types.uint_8, speed: wf_types.uint_16, pulses: wf_types.uint_32, verbose: bool = False, blocking: bool = False) -> bool:
         """
         #### Description:
         Sends a relative (incremental) move command to the servo controller.
+        By default the call returns as soon as the controller acknowledges the command, so the caller can queue the next move or do other work during the motion; call `await_stop()` to wait for completion.
         #### Args:
             direction (wf_types.Direction): The direction of movement (CW=0x00 or CCW=0x01).
             acceleration (wf_types.uint_8): The acceleration setting (0-255).
             speed (wf_types.uint_16): The movement speed (0-65535).
             pulses (wf_types.uint_32): The distance to move in microsteps (pulses) (0-4,294,967,295).
             verbose (bool, optional)
+            blocking (bool, optional): If True, also wait for the motor to stop (`await_stop()`) before returning. Defaults to False.
 
         #### Returns:
-            bool: True if the multi-register write command was successfully sent and acknowledged, 
+            bool: True if the multi-register write command was successfully sent and acknowledged (and, when blocking, the motor stopped), 
                   False otherwise.
 
         #### Raises:
@@ -1206,46 +1385,31 @@ class Servo42dModbus:
             MKS SERVO42D RS485 User Manual V1.0.6, Section 8.3.4.1, Page 79.
 
         #### Last Revision:
-            2025-11-04 13:20 PM ET, Weston Forbes
+            2026-10-15 07:50 PM ET, Weston Forbes
         """
         if verbose: Console.fancy_print("<INFO>\nsending relative move by pulses command...</INFO>")
 
-        # Type check parameters.
-        if not TypeCheck.is_enum(direction, wf_types.Direction): raise TypeError("direction must be a valid Direction enum.")
-        if not TypeCheck.is_uint8(acceleration): raise TypeError("acceleration must be an unsigned 8-bit integer (0-255).")
-        if not TypeCheck.is_uint16(speed): raise TypeError("speed must be an unsigned 16-bit integer (0-65535).")
-        if not TypeCheck.is_uint32(pulses): raise TypeError("pulses must be an unsigned 32-bit integer (0-4294967295).")
-        if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
+        # Type check parameters. Inlined for the motion loops. Direction is always checked, since struct would pack any byte;
+        # python -O strips the rest (struct then rejects out-of-range acceleration, speed and pulses).
+        if direction.__class__ is not wf_types.Direction: raise TypeError("direction must be a valid Direction enum.")
+        if __debug__:
+            if acceleration.__class__ is not int or acceleration >> 8: raise TypeError("acceleration must be an unsigned 8-bit integer (0-255).")
+            if speed.__class__ is not int or speed >> 16: raise TypeError("speed must be an unsigned 16-bit integer (0-65535).")
+            if pulses.__class__ is not int or pulses >> 32: raise TypeError("pulses must be an unsigned 32-bit integer (0-4294967295).")
+            if verbose.__class__ is not bool: raise TypeError("verbose must be a boolean.")
+            if blocking.__class__ is not bool: raise TypeError("blocking must be a boolean.")
 
         # Expected successful response for write_multiple_registers is 8 bytes: 
         # [Slave, 0x10, StartAddr_HI, StartAddr_LO, NumRegs_HI, NumRegs_LO, CRC_HI, CRC_LO]
-        response = []
+        response = b""
 
         # Try protect...
         try:
-            command, response = self.modbus.write_multiple_registers(
-                slave_address = self.slave_address,
-                starting_address = 0x00FD,
-                register_quantity = 0x0004,
-                byte_quantity=0x08,
-                payload = [
-                    # Register 0x00FD (1 byte Direction, 1 byte Acceleration)
-                    direction.value,
-                    acceleration,
-                    
-                    # Register 0x00FE (2 bytes Speed)
-                    (speed >> 8) & 0xFF,
-                    speed & 0xFF,
-                    
-                    # Register 0x00FF & 0x0100 (4 bytes Pulses) - Big Endian (HI to LO)
-                    (pulses >> 8 * 3) & 0xFF,
-                    (pulses >> 8 * 2) & 0xFF,
-                    (pulses >> 8 * 1) & 0xFF,
-                    pulses & 0xFF
-                ],
-                response_length= 8,
-                verbose = verbose
-            )
+            # Registers 0x00FD (direction, acceleration), 0x00FE (speed), 0x00FF-0x0100 (pulses), big endian, on the prebuilt FC10 header.
+            header, crc = self._move_frame
+            payload = self._MOVE_STRUCT.pack(direction, acceleration, speed, pulses)
+            received = self.modbus.write_frame_into(header + payload + Modbus.crc16_update(crc, payload).to_bytes(2, 'little'), self._rx_view[:_ResponseLength.WRITE], verbose)
+            response = self._rx_view[:received]
         
         # Catch exceptions.
         except Exception as e:
@@ -1253,9 +1417,9 @@ class Servo42dModbus:
             raise RuntimeError(f"exception occurred while attempting relative move by pulses: {e}")
 
         # Check response.
-        if response and response[:6] == [self.slave_address, 0x10, 0x00, 0xFD, 0x00, 0x04]:
+        if response[:6] == self._move_echo_prefix:
             if verbose: Console.fancy_print("<GOOD>relative move by pulses command sent successfully.</GOOD>")
-            return True
+            return self.await_stop(verbose=verbose) if blocking else True
         else: 
             if verbose: Console.fancy_print("<BAD>failed to send relative move by pulses command (unexpected response).</BAD>")
             return False
@@ -1264,6 +1428,631 @@ class Servo42dModbus:
     
     # region: Work region--------------------------------------------------------------------------------------------------------
 
+    def _write_single(self, register: wf_types.uint_16, value: wf_types.uint_16, verbose: bool = False, sink: list[str] | None = None) -> tuple[bytes, memoryview]:
+        """
+        #### Description:
+        Write a single register (FC06) from the frame template built when the slave address was set.
+        Only the register address and value are packed and fed into the precomputed CRC, instead of building and validating the whole packet in Modbus.write_single_register.
+
+        #### Args:
+            register (wf_types.uint_16): Register address.
+            value (wf_types.uint_16): Value to write.
+            verbose (bool, optional)
+            sink (list[str], optional): If given, output lines are appended here instead of printed, for the caller to print once. Defaults to None.
+
+        #### Returns:
+            tuple[bytes, memoryview]: The command sent and the response read. A successful write echoes the command.
+            The response is a view into the shared receive buffer; compare it before the next transaction overwrites it.
+
+        #### Raises:
+            struct.error: If register or value is not an unsigned 16-bit integer.
+            Exceptions from the serial connection are passed on.
+
+        #### Last Revision:
+            2026-10-15 07:40 PM ET, Weston Forbes
+        """
+        header, crc = self._single_write_frame
+        body = self._SINGLE_WRITE_STRUCT.pack(register, value)
+        command = header + body + Modbus.crc16_update(crc, body).to_bytes(2, 'little')
+        received = self.modbus.write_frame_into(command, self._rx_view[:_ResponseLength.WRITE], verbose, sink)
+        return command, self._rx_view[:received]
+
+    def _write_if_changed(self, register: wf_types.uint_16, value: wf_types.uint_16, verbose: bool = False, sink: list[str] | None = None) -> bool:
+        """
+        #### Description:
+        Write a single configuration register (FC06) unless the register cache says it already holds value.
+        The cache is filled by successful writes and by read_all_config_parameters, and cleared by invalidate_cache.
+
+        #### Args:
+            register (wf_types.uint_16): Register address.
+            value (wf_types.uint_16): Value to write.
+            verbose (bool, optional)
+            sink (list[str], optional): If given, output lines are appended here instead of printed, for the caller to print once. Defaults to None.
+
+        #### Returns:
+            bool: True if the register holds value afterwards (write skipped or echoed), False if the write was not echoed.
+
+        #### Raises:
+            Exceptions from _write_single are passed on; the calling setter wraps them in RuntimeError.
+
+        #### Last Revision:
+            2026-10-15 07:40 PM ET, Weston Forbes
+        """
+        emit = Console.fancy_print if sink is None else sink.append  # Output goes to the console, or to the caller's list.
+        if self._reg_cache.get(register) == value:
+            if verbose: emit(f"<DATA>register 0x{register:04X} already holds 0x{value:04X}, write skipped.</DATA>")
+            return True
+
+        command, response = self._write_single(register, value, verbose=verbose, sink=sink)
+
+        # A successful write echoes the command.
+        self._config_dirty = True
+        if response == command:
+            self._reg_cache[register] = value
+            return True
+        self._reg_cache.pop(register, None)
+        return False
+
+    def invalidate_cache(self) -> None:
+        """
+        #### Description:
+        Forget the cached register values and configuration, so the next setter call writes to the controller and the next configuration read goes to the bus.
+        Call this after changing settings from the controller's screen.
+
+        #### Last Revision:
+            2026-10-15 12:50 PM ET, Weston Forbes
+        """
+        self._reg_cache.clear()
+        self._config_dirty = True
+
+    def _write_config_fields(self, updates: dict[int, wf_types.uint_8], verbose: bool = False, sink: list[str] | None = None) -> bool:
+        """
+        #### Description:
+        Writes configuration parameter block fields through their documented single registers (FC06), skipping the ones the controller already holds.
+        The block is read first, so fields that already hold the requested value cost no transaction; the manual only documents writing the block as a whole (all 19 registers, communication settings included), so it is not written directly.
+
+        #### Args:
+            updates (dict[int, wf_types.uint_8]): Map of `_ConfigByte` positions to the byte value to write there.
+            verbose (bool, optional)
+            sink (list[str], optional): If given, output lines are appended here instead of printed, for the caller to print once. Defaults to None.
+
+        #### Returns:
+            bool: True if the controller holds the requested values afterwards, False if a write was not echoed or a position has no single register.
+
+        #### Raises:
+            RuntimeError: If reading or writing fails due to a communication error.
+            ValueError: If the current block cannot be read back.
+
+        #### Documentation:
+            MKS SERVO42D RS485 User Manual V1.0.6, Section 8.2, Page 61-67 (single registers) and Section 8.3.2, Page 73 (Read parameters).
+
+        #### Last Revision:
+            2026-10-15 07:40 PM ET, Weston Forbes
+        """
+        emit = Console.fancy_print if sink is None else sink.append  # Output goes to the console, or to the caller's list.
+        if verbose: emit("<INFO>\nwriting configuration parameters...</INFO>")
+
+        # Read the current block; this also refreshes the register cache that _write_if_changed compares against.
+        self.read_all_config_parameters(verbose=False)
+        block = bytearray(self._config_buffer)
+        for position, value in updates.items(): block[position] = value
+
+        remaining = set(updates)
+        written = True
+
+        # Try protect...
+        try:
+            for positions, register in self._CONFIG_REGISTERS:
+                if remaining.isdisjoint(positions): continue
+                remaining.difference_update(positions)
+                value = int.from_bytes(bytes(block[position] for position in positions), 'big')
+                written = self._write_if_changed(register, value, verbose=verbose, sink=sink) and written
+
+        # Catch exceptions.
+        except Exception as e:
+            if verbose: emit(f"<BAD>exception occurred while writing configuration parameters: {e}</BAD>")
+            raise RuntimeError(f"exception occurred while writing configuration parameters: {e}")
+
+        if remaining:
+            if verbose: emit(f"<BAD>no single register for configuration bytes {sorted(remaining)}.</BAD>")
+            return False
+        if verbose: emit("<GOOD>configuration parameters written successfully.</GOOD>" if written else "<BAD>failed to write configuration parameters.</BAD>")
+        return written
+
+    def write_configuration(self, work_mode: wf_types.WorkMode | None = None, working_current_ma: wf_types.uint_16 | None = None, microsteps: wf_types.uint_8 | None = None, steps_per_revolution: wf_types.uint_8 = 200, holding_current_percentage: wf_types.HoldCurrentPercentage | None = None, verbose: bool = False) -> bool:
+        """
+        #### Description:
+        Apply several configuration settings at once, writing only the ones the controller does not already hold.
+        Settings left as None keep their current value on the controller.
+        Equivalent to calling set_work_mode, set_working_current, set_step_parameters and set_holding_current_percentage, but the parameter block is read once up front and unchanged settings cost no transaction.
+
+        #### Args:
+            work_mode (wf_types.WorkMode, optional): Work mode (register 0x0082).
+            working_current_ma (wf_types.uint_16, optional): Working current in mA, 250-3000 (register 0x0083).
+            microsteps (wf_types.uint_8, optional): Microsteps per full step (register 0x0084).
+            steps_per_revolution (wf_types.uint_8, optional): Full steps per revolution, recorded with microsteps for the degree-based moves. Defaults to 200.
+            holding_current_percentage (wf_types.HoldCurrentPercentage, optional): Holding current (register 0x009B).
+            verbose (bool, optional)
+
+        #### Returns:
+            bool: True if the controller acknowledged every write (or already held the values), False otherwise.
+
+        #### Raises:
+            TypeError: If any parameter is of incorrect type.
+            ValueError: If working_current_ma is outside 250-3000 mA, or the current parameter block cannot be read.
+            RuntimeError: If reading or writing the parameter block fails due to a communication error.
+
+        #### Documentation:
+            MKS SERVO42D RS485 User Manual V1.0.6, Section 8.3, Page 72-73 (Read/Write all parameters).
+
+        #### Last Revision:
+            2026-10-15 06:20 PM ET, Weston Forbes
+        """
+        # Type check parameters.
+        if work_mode is not None and not TypeCheck.is_enum(work_mode, wf_types.WorkMode): raise TypeError("work_mode must be a valid WorkMode enum.")
+        if working_current_ma is not None and not TypeCheck.is_uint16(working_current_ma): raise TypeError("working_current must be a valid uint_16.")
+        if microsteps is not None and not TypeCheck.is_uint8(microsteps): raise TypeError("microsteps must be a valid uint_8.")
+        if not TypeCheck.is_uint8(steps_per_revolution): raise TypeError("steps_per_revolution must be a valid uint_8.")
+        if holding_current_percentage is not None and not TypeCheck.is_enum(holding_current_percentage, wf_types.HoldCurrentPercentage): raise TypeError("holding_current_percentage must be a valid HoldCurrentPercentage enum.")
+        if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
+
+        # Check the valid range for working current.
+        if working_current_ma is not None and (working_current_ma < 250 or working_current_ma > 3000):
+            raise ValueError("working_current must be between 250 and 3000 mA.")
+
+        # Collect the parameter block bytes to change.
+        updates = {}
+        if work_mode is not None: updates[_ConfigByte.MODE] = work_mode.value
+        if working_current_ma is not None:
+            updates[_ConfigByte.WORKING_CURRENT_HI] = (working_current_ma >> 8) & 0xFF
+            updates[_ConfigByte.WORKING_CURRENT_LO] = working_current_ma & 0xFF
+        if microsteps is not None: updates[_ConfigByte.MICROSTEPS] = microsteps
+        if holding_current_percentage is not None: updates[_ConfigByte.HOLD_CURRENT] = holding_current_percentage.value
+
+        if not self._write_config_fields(updates, verbose=verbose): return False
+        if microsteps is not None: self._store_step_parameters(microsteps, steps_per_revolution)
+        return True
+
+    def set_low_latency(self, enable: bool = True, verbose: bool = False) -> bool:
+        """
+        #### Description:
+        Enables (or disables) low latency mode on the serial port used to talk to the servo.
+        On Linux this sets ASYNC_LOW_LATENCY on the port, which drops a USB-RS485 adapter's latency timer from 16 ms to about 1 ms and shortens every request/response round-trip.
+        Has no effect on other platforms; on Windows the FTDI latency timer is set in the driver's advanced port settings instead.
+
+        #### Args:
+            enable (bool, optional): True to enable low latency mode, False to restore the default. Defaults to True.
+            verbose (bool, optional)
+
+        #### Returns:
+            bool: True if the port was updated, False if the platform or adapter does not support it.
+
+        #### Raises:
+            TypeError: If any parameter is not a boolean.
+
+        #### Last Revision:
+            2026-10-15 10:31 AM ET, Weston Forbes
+        """
+        if verbose: Console.fancy_print(f"<INFO>\n{'enabling' if enable else 'disabling'} low latency mode...</INFO>")
+
+        # Type check parameters.
+        if not TypeCheck.is_bool(enable): raise TypeError("enable must be a boolean.")
+        if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
+
+        return self.modbus.set_low_latency(enable=enable, verbose=verbose)
+
+    def make_move_emitter(self, direction: wf_types.Direction, acceleration: wf_types.uint_8, speed: wf_types.uint_16, verbose: bool = False) -> Callable[[wf_types.uint_32], bool]:
+        """
+        #### Description:
+        Builds a relative move function specialized for a fixed direction, acceleration and speed.
+        The fixed arguments are validated and packed once, so each call of the returned function only encodes the pulse count, sends the command and checks the echo.
+        Intended for trajectories that issue many relative moves at a constant velocity.
+
+        #### Args:
+            direction (wf_types.Direction): The direction of movement (CW=0x00 or CCW=0x01).
+            acceleration (wf_types.uint_8): The acceleration setting (0-255).
+            speed (wf_types.uint_16): The movement speed (0-65535).
+            verbose (bool, optional): Passed to every Modbus transaction issued by the returned function.
+
+        #### Returns:
+            Callable[[wf_types.uint_32], bool]: A function taking pulses (0-4,294,967,295) that returns True if the move was acknowledged, False otherwise.
+            It raises TypeError if pulses is not a valid uint_32 and RuntimeError if sending the command fails.
+
+        #### Raises:
+            TypeError: If any parameter is of incorrect type.
+
+        #### Documentation:
+            MKS SERVO42D RS485 User Manual V1.0.6, Section 8.3.4.1, Page 79.
+
+        #### Last Revision:
+            2026-10-15 05:45 PM ET, Weston Forbes
+        """
+
+        # Type check parameters.
+        if not TypeCheck.is_enum(direction, wf_types.Direction): raise TypeError("direction must be a valid Direction enum.")
+        if not TypeCheck.is_uint8(acceleration): raise TypeError("acceleration must be an unsigned 8-bit integer (0-255).")
+        if not TypeCheck.is_uint16(speed): raise TypeError("speed must be an unsigned 16-bit integer (0-65535).")
+        if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
+
+        # Capture everything that does not change between moves: the frame up to the pulse count and its CRC register.
+        write_frame_into = self.modbus.write_frame_into
+        rx_view = self._rx_view
+        rx_buffer = rx_view[:_ResponseLength.WRITE]
+        crc16_update = Modbus.crc16_update
+        echo_prefix = self._move_echo_prefix
+        header, crc = self._move_frame
+        prefix = self._SPEED_STRUCT.pack(direction, acceleration, speed)  # Registers 0x00FD-0x00FE: direction, acceleration, speed.
+        frame_prefix = header + prefix
+        prefix_crc = crc16_update(crc, prefix)
+
+        def emit(pulses: wf_types.uint_32) -> bool:
+
+            # Type check parameter. Inlined for the per-move hot path; python -O strips it.
+            if __debug__:
+                if pulses.__class__ is not int or pulses >> 32: raise TypeError("pulses must be an unsigned 32-bit integer (0-4294967295).")
+
+            # Try protect...
+            try:
+                pulse_bytes = pulses.to_bytes(4, 'big')  # Registers 0x00FF-0x0100: pulses, big endian.
+                received = write_frame_into(frame_prefix + pulse_bytes + crc16_update(prefix_crc, pulse_bytes).to_bytes(2, 'little'), rx_buffer, verbose)
+
+            # Catch exceptions.
+            except Exception as e:
+                if verbose: Console.fancy_print(f"<BAD>exception occurred while attempting relative move by pulses: {e}</BAD>")
+                raise RuntimeError(f"exception occurred while attempting relative move by pulses: {e}")
+
+            # Check response. Slice to what arrived, so a short reply can't match a previous echo left in the buffer.
+            return rx_view[:received][:6] == echo_prefix
+
+        return emit
+
+    def stop_movement(self, deceleration: wf_types.uint_8, verbose: bool = False) -> bool:
+        """
+        #### Description:
+        Stops a move started with `move_at_speed()` by commanding speed 0 with the given deceleration.
+        Sends the same two registers as `move_at_speed()` (0x00F6 direction/acceleration, 0x00F7 speed) and nothing past them.
+
+        #### Args:
+            deceleration (wf_types.uint_8): The deceleration value (0-255). 0 stops the motor immediately, which is not recommended above 1000 RPM.
+            verbose (bool, optional)
+
+        #### Returns:
+            bool: True if the stop command was acknowledged, False otherwise.
+
+        #### Raises:
+            TypeError: If a parameter is of incorrect type.
+            RuntimeError: If sending the command fails due to a communication error.
+
+        #### Documentation:
+            MKS SERVO42D RS485 User Manual V1.0.6, Section 8.3.3.1, Page 77; Part 6, Page 41 (stop the motor in speed mode).
+
+        #### Last Revision:
+            2026-10-15 05:20 PM ET, Weston Forbes
+        """
+        return self.move_at_speed(wf_types.Direction.CW, deceleration, 0, verbose=verbose)
+
+    def write_motion_block(self, starting_address: wf_types.uint_16, values: list[int], verbose: bool = False) -> bool:
+        """
+        #### Description:
+        Writes a run of contiguous registers in a single FC10 (write multiple registers) transaction.
+        Use it to send several parameters that live next to each other in one frame instead of one write per register, e.g. a move at speed (0x00F6-0x00F7) or a relative move (0x00FD-0x0100) built by the caller.
+        Only registers that are contiguous can be combined; the controller's motion registers and configuration registers are not, so those still need separate writes.
+
+        #### Args:
+            starting_address (wf_types.uint_16): Address of the first register.
+            values (list[int]): Register values in address order, each an unsigned 16-bit integer (1-123 registers).
+            verbose (bool, optional)
+
+        #### Returns:
+            bool: True if the servo acknowledged the write, False otherwise.
+
+        #### Raises:
+            TypeError: If a parameter is of incorrect type.
+            ValueError: If values is empty, too long, or holds a value outside 0-65535.
+            RuntimeError: If sending the command fails due to a communication error.
+
+        #### Documentation:
+            MKS SERVO42D RS485 User Manual V1.0.6, Section 8.3.3.1, Page 77 (move at speed) and Section 8.3.4.1, Page 79 (relative move by pulses).
+
+        #### Last Revision:
+            2026-10-15 03:55 PM ET, Weston Forbes
+        """
+
+        # Type check parameters.
+        if not TypeCheck.is_uint16(starting_address): raise TypeError("starting_address must be an unsigned 16-bit integer (0-65535).")
+        if not TypeCheck.is_int_list(values): raise TypeError("values must be a list of integers.")
+        if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
+        if not 1 <= len(values) <= 123: raise ValueError("values must hold between 1 and 123 registers.")
+        if not all(map(TypeCheck.is_uint16, values)): raise ValueError("every value must be an unsigned 16-bit integer (0-65535).")
+
+        register_quantity = len(values)
+
+        # Try protect...
+        try:
+            command, response = self.modbus.write_multiple_registers(
+                slave_address = self.slave_address,
+                starting_address = starting_address,
+                register_quantity = register_quantity,
+                byte_quantity = register_quantity * 2,
+                payload = struct.pack(f'>{register_quantity}H', *values),  # One big endian word per register.
+                response_length = _ResponseLength.WRITE,
+                verbose = verbose
+            )
+
+        # Catch exceptions.
+        except Exception as e:
+            if verbose: Console.fancy_print(f"<BAD>exception occurred while writing motion block: {e}</BAD>")
+            raise RuntimeError(f"exception occurred while writing motion block: {e}")
+
+        # The written registers may overlap cached configuration registers; forget them either way.
+        for register in range(starting_address, starting_address + register_quantity): self._reg_cache.pop(register, None)
+
+        # Check response. A successful write echoes address, function, starting address and quantity.
+        if response[:6] == self._WRITE_ECHO_FMT.pack(self.slave_address, 0x10, starting_address, register_quantity):
+            if verbose: Console.fancy_print("<GOOD>motion block written successfully.</GOOD>")
+            return True
+        else:
+            if verbose: Console.fancy_print("<BAD>failed to write motion block (unexpected response).</BAD>")
+            return False
+
+    def read_motor_status(self, verbose: bool = False, max_age: float = 0.0) -> wf_types.Status:
+        """
+        #### Description:
+        Read the motor status (stopped, accelerating, homing, calibrating, ...).
+        With max_age, a status read less than max_age seconds ago is returned without a bus transaction, so several callers polling in the same interval share one read.
+
+        #### Args:
+            verbose (bool, optional)
+            max_age (float, optional): Oldest cached status to accept, in seconds. Defaults to 0.0 (always read).
+
+        #### Returns:
+            wf_types.Status: The motor status reported by the controller.
+
+        #### Raises:
+            TypeError: If verbose is not a boolean or max_age is not a float.
+            RuntimeError: If reading the register fails due to a communication error.
+            ValueError: If the response is invalid or holds an unknown status value.
+
+        #### Documentation:
+            MKS SERVO42D RS485 User Manual V1.0.6, Section 8.1.10, Page 59.
+
+        #### Last Revision:
+            2026-10-15 05:30 PM ET, Weston Forbes
+        """
+        if verbose: Console.fancy_print("<INFO>\nreading motor status...</INFO>")
+
+        # Type check parameters.
+        if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
+        if not TypeCheck.is_number(max_age): raise TypeError("max_age must be a number.")
+
+        # Serve a recent enough status from the cache.
+        read_at, status = self._status_cache
+        if status is not None and time.monotonic() - read_at < max_age:
+            if verbose: Console.fancy_print(f"<GOOD>motor status (cached): {status.name}.</GOOD>")
+            return status
+
+        # Read from register into the shared receive buffer.
+        try:
+            command, received = self.modbus.read_input_registers_into(
+                slave_address = self.slave_address,
+                starting_address = _Register.MOTOR_STATUS,
+                register_quantity = 0x0001,
+                buffer = self._rx_view[:_ResponseLength.READ_SINGLE_REGISTER],
+                verbose = verbose
+            )
+            response = self._rx_view[:received]
+        except Exception as e:
+            if verbose: Console.fancy_print(f"<BAD>exception occurred while reading motor status: {e}</BAD>")
+            raise RuntimeError(f"exception occurred while reading motor status: {e}")
+
+        # Check the frame (CRC and header), then map the status byte.
+        if Modbus.verify_crc(response) and response[:4] == self._status_reply_header and response[4] < len(self._STATUS_LUT):
+            status = self._STATUS_LUT[response[4]]
+            self._status_cache = (time.monotonic(), status)
+            if verbose: Console.fancy_print(f"<GOOD>motor status: {status.name}.</GOOD>")
+            return status
+        else:
+            if verbose: Console.fancy_print("<BAD>failed to read motor status from servo (unexpected response).</BAD>")
+            raise ValueError("failed to read motor status from servo.")
+
+    def read_state_block(self, verbose: bool = False) -> dict:
+        """
+        #### Description:
+        Reads all status parameters (motor status, IO ports, encoder, speed, pulses, angle error, EN/zero/protection status) in a single transaction.
+        Replaces separate reads of registers 0x00F1, 0x0034, 0x0031, 0x0032, 0x0033, 0x0035, 0x0039, 0x003A, 0x003B and 0x003E.
+        The motor status is also stored for `read_motor_status(max_age=...)`.
+
+        #### Args:
+            verbose (bool, optional)
+
+        #### Returns:
+            dict: A dictionary containing:
+                - status (wf_types.Status): Motor status.
+                - io_status (int): IO port status byte.
+                - encoder_value (int): Encoder value (addition), signed 48-bit, 16384 units per revolution.
+                - speed_rpm (int): Current speed in RPM (signed).
+                - pulses (int): Number of pulses received (signed 32-bit).
+                - raw_encoder_value (int): Raw encoder value, signed 48-bit.
+                - angle_error (int): Shaft angle error (signed 32-bit).
+                - en_pin_status (bool | None): EN pin status, None if the controller reported an unknown value.
+                - zero_status (int): Go back to zero status byte.
+                - shaft_protection_status (bool | None): Shaft protection status, None if the controller reported an unknown value.
+
+        #### Raises:
+            TypeError: If verbose is not a boolean.
+            RuntimeError: If reading the registers fails due to a communication error.
+            ValueError: If the response is invalid or holds an unknown motor status.
+
+        #### Documentation:
+            MKS SERVO42D RS485 User Manual V1.0.6, Section 8.3, Page 74-75 (Read all status parameters).
+
+        #### Last Revision:
+            2026-10-15 05:30 PM ET, Weston Forbes
+        """
+        if verbose: Console.fancy_print("<INFO>\nreading all status parameters...</INFO>")
+
+        # Type check parameter.
+        if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
+
+        # Read from register into the shared receive buffer.
+        try:
+            command, received = self.modbus.read_input_registers_into(
+                slave_address = self.slave_address,
+                starting_address = _Register.STATUS_PARAMETERS,
+                register_quantity = _Register.STATUS_PARAMETERS_COUNT,
+                buffer = self._rx_view[:_ResponseLength.STATUS_PARAMETERS],
+                verbose = verbose
+            )
+            response = self._rx_view[:received]
+        except Exception as e:
+            if verbose: Console.fancy_print(f"<BAD>exception occurred while reading status parameters: {e}</BAD>")
+            raise RuntimeError(f"exception occurred while reading status parameters: {e}")
+
+        # Check the frame (length, CRC and header) and the status byte.
+        if not (received == _ResponseLength.STATUS_PARAMETERS and Modbus.verify_crc(response) and response[:3] == self._state_read_header and response[3] < len(self._STATUS_LUT)):
+            if verbose: Console.fancy_print("<BAD>failed to read status parameters from servo (unexpected response).</BAD>")
+            raise ValueError("failed to read status parameters from servo.")
+
+        # Decode the data bytes in one unpack; the two 48-bit fields come out as 6 byte strings.
+        status, io_status, encoder, speed, pulses, raw_encoder, error, en_pin, zero_status, protection = self._STATE_STRUCT.unpack_from(response, 3)
+        status = self._STATUS_LUT[status]
+        self._status_cache = (time.monotonic(), status)
+        state = {
+            "status": status,
+            "io_status": io_status,
+            "encoder_value": Parse.parse_int48(encoder),
+            "speed_rpm": speed,
+            "pulses": pulses,
+            "raw_encoder_value": Parse.parse_int48(raw_encoder),
+            "angle_error": error,
+            "en_pin_status": self._STATUS_MAP.get(en_pin),
+            "zero_status": zero_status,
+            "shaft_protection_status": self._STATUS_MAP.get(protection),
+        }
+
+        if verbose: Console.fancy_print("<DATA>" + "\n".join(f"{key}: {getattr(value, 'name', value)}" for key, value in state.items()) + "</DATA>")
+        return state
+
+    def wait_until_status(self, status: wf_types.Status, timeout: float = 20.0, max_poll: float = 0.2, verbose: bool = False, on_state: Callable[[dict], None] | None = None, settle: float = 0.0) -> bool:
+        """
+        #### Description:
+        Block until the controller reports the given motor status, by polling the motor status register.
+        The first reads follow each other closely (a few character times on the wire); the delay then doubles up to max_poll, so short operations return quickly and long ones don't keep the bus busy.
+        When waiting for the end of an operation that was just started, the first read may land before the controller has left the target status. The target therefore only counts once a different status (or a failed read, e.g. while the controller is busy calibrating) has been seen, or `settle` seconds have passed.
+        Failed reads are treated as "not there yet" and counted in `last_wait_failed_reads`.
+
+        #### Args:
+            status (wf_types.Status): Status to wait for.
+            timeout (float, optional): Maximum time to wait in seconds. Defaults to 20.0.
+            max_poll (float, optional): Longest delay between status reads in seconds. Defaults to 0.2.
+            verbose (bool, optional)
+            on_state (Callable[[dict], None], optional): If given, each poll reads the whole status block (`read_state_block()`) instead of the status register alone, and passes it here, e.g. to track position and speed during a move. Defaults to None.
+            settle (float, optional): Time in seconds after which the target status counts even if no other status was seen. 0.0 accepts it on the first read; pass timeout or more to require a change. Defaults to 0.0.
+
+        #### Returns:
+            bool: True if the status was reported within the timeout, False otherwise.
+
+        #### Raises:
+            TypeError: If a parameter is of incorrect type.
+            ValueError: If timeout or max_poll is not positive, or settle is negative.
+
+        #### Documentation:
+            MKS SERVO42D RS485 User Manual V1.0.6, Section 8.1.10, Page 59.
+
+        #### Last Revision:
+            2026-10-15 06:50 PM ET, Weston Forbes
+        """
+        # Type check parameters.
+        if not TypeCheck.is_enum(status, wf_types.Status): raise TypeError("status must be a valid Status enum.")
+        if on_state is not None and not callable(on_state): raise TypeError("on_state must be callable or None.")
+        if not TypeCheck.is_number(timeout): raise TypeError("timeout must be a number.")
+        if not TypeCheck.is_number(max_poll): raise TypeError("max_poll must be a number.")
+        if not TypeCheck.is_number(settle): raise TypeError("settle must be a number.")
+        if not TypeCheck.is_bool(verbose): raise TypeError("verbose must be a boolean.")
+        if timeout <= 0 or max_poll <= 0: raise ValueError("timeout and max_poll must be positive.")
+        if settle < 0: raise ValueError("settle must not be negative.")
+
+        if verbose: Console.fancy_print(f"<INFO>\nwaiting for motor status {status.name}...</INFO>")
+
+        started = time.monotonic()
+        deadline = started + timeout
+        settled_at = started + settle
+        interval = min(self._poll_interval, max_poll)
+        left_status = False
+        self.last_wait_failed_reads = 0
+        while True:
+
+            # Try protect... the controller may not answer while it is busy.
+            try:
+                if on_state is None: current = self.read_motor_status(verbose=False)
+                else:
+                    state = self.read_state_block(verbose=False)
+                    on_state(state)
+                    current = state["status"]
+            except (RuntimeError, ValueError) as e:
+                self.last_wait_failed_reads += 1
+                left_status = True
+                if verbose: Console.fancy_print(f"<BAD>status read {self.last_wait_failed_reads} failed: {e}</BAD>")
+            else:
+                if current != status: left_status = True
+                elif left_status or time.monotonic() >= settled_at:
+                    if verbose: Console.fancy_print(f"<GOOD>motor status is {status.name} ({self.last_wait_failed_reads} failed reads).</GOOD>")
+                    return True
+
+            if time.monotonic() + interval > deadline:
+                if verbose: Console.fancy_print(f"<BAD>motor status did not reach {status.name} within {timeout} seconds ({self.last_wait_failed_reads} failed reads).</BAD>")
+                return False
+            time.sleep(interval)
+            interval = min(interval * 2, max_poll)
+
+    def await_stop(self, timeout: float = 20.0, verbose: bool = False, settle: float = 0.1) -> bool:
+        """
+        #### Description:
+        Block until the motor reports STOP, e.g. after a move submitted with `relative_move_by_pulses()`.
+        A STOP read before the motor has been seen moving only counts after `settle` seconds, so a poll that lands before the move starts doesn't end the wait early.
+
+        #### Args:
+            timeout (float, optional): Maximum time to wait in seconds. Defaults to 20.0.
+            verbose (bool, optional)
+            settle (float, optional): See `wait_until_status()`. Long enough for the controller to start the move; a move of 0 pulses returns after it. Defaults to 0.1.
+
+        #### Returns:
+            bool: True if the motor stopped within the timeout, False otherwise.
+
+        #### Raises:
+            TypeError: If a parameter is of incorrect type.
+            ValueError: If timeout is not positive or settle is negative.
+
+        #### Last Revision:
+            2026-10-15 06:50 PM ET, Weston Forbes
+        """
+        return self.wait_until_status(wf_types.Status.STOP, timeout=timeout, verbose=verbose, settle=settle)
+
+    def wait_for_calibration(self, timeout: float = 20.0, poll: float = 0.2, verbose: bool = False) -> bool:
+        """
+        #### Description:
+        Block until a calibration started with calibrate() has finished, i.e. until the motor reports STOP again after reporting CALIBRATION (or not answering while busy).
+        Returns as soon as calibration is done, instead of waiting out a fixed delay. A STOP that was never preceded by calibration activity does not count, so the result is False if calibration never started.
+
+        #### Args:
+            timeout (float, optional): Maximum time to wait in seconds. Defaults to 20.0.
+            poll (float, optional): Longest delay between status reads in seconds (see wait_until_status). Defaults to 0.2.
+            verbose (bool, optional)
+
+        #### Returns:
+            bool: True if calibration finished within the timeout, False otherwise.
+
+        #### Raises:
+            TypeError: If a parameter is of incorrect type.
+            ValueError: If timeout or poll is not positive.
+
+        #### Documentation:
+            MKS SERVO42D RS485 User Manual V1.0.6, Section 8.1.10, Page 59 and Section 8.2.5, Page 60.
+
+        #### Last Revision:
+            2026-10-15 06:50 PM ET, Weston Forbes
+        """
+        return self.wait_until_status(wf_types.Status.STOP, timeout=timeout, max_poll=poll, verbose=verbose, settle=timeout)
 
     # endregion
 
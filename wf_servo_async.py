@@ -0,0 +1,138 @@
+# region: Imports----------------------------------------------------------------------------------------------------------------
+from wf_servo import Servo42dModbus
+from wf_types import TypeCheck
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+import wf_types
+import asyncio
+
+# endregion
+
+class Servo42dModbusAsync:
+    """
+    #### Description:
+    asyncio front end for Servo42dModbus.
+    Each servo gets one worker thread that owns its serial port, so commands to the same servo stay in order while servos on different ports run their transactions concurrently.
+    The blocking Servo42dModbus methods are unchanged; this class only schedules them.
+    Code without an event loop can use `submit()`, which queues a command on the same worker and returns a concurrent.futures.Future.
+
+    #### Example:
+        servos = [Servo42dModbusAsync("COM4"), Servo42dModbusAsync("COM5")]
+        await asyncio.gather(*(servo.relative_move_by_pulses(Direction.CW, 10, 600, 3200) for servo in servos))
+    """
+
+    # region: Class attributes---------------------------------------------------------------------------------------------------
+    __slots__ = ('servo', '_executor')
+    servo: Servo42dModbus
+    _executor: ThreadPoolExecutor
+    # endregion
+
+    # region: Initialization-----------------------------------------------------------------------------------------------------
+    def __init__(self, com_port: str, slave_address: wf_types.uint_8 = 1, microsteps_per_step: wf_types.uint_8 = 16, steps_per_revolution: wf_types.uint_8 = 200, cache_configuration: bool = False, low_latency: bool = True, baudrate: int = 38400, timeout: float | None = None) -> None:
+
+        # Create the blocking servo; it type checks its own parameters.
+        self.servo = Servo42dModbus(com_port=com_port, slave_address=slave_address, microsteps_per_step=microsteps_per_step, steps_per_revolution=steps_per_revolution, cache_configuration=cache_configuration, low_latency=low_latency, baudrate=baudrate, timeout=timeout)
+
+        # One worker per servo. The serial port is not shared between threads, so requests to it must not overlap.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"servo42d-{com_port}")
+
+    def close(self) -> None:
+        """Wait for queued commands to finish, stop the worker thread and close the serial port."""
+        self._executor.shutdown(wait=True)
+        self.servo.close()
+
+    async def __aenter__(self) -> "Servo42dModbusAsync":
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    # endregion
+
+    # region: Commands-----------------------------------------------------------------------------------------------------------
+
+    def submit(self, method_name: str, *args: Any, **kwargs: Any) -> Future:
+        """
+        #### Description:
+        Queue any Servo42dModbus method on the servo's worker thread and return immediately.
+        The caller keeps running while the command waits on the serial port; commands to one servo run in submission order.
+
+        #### Args:
+            method_name (str): Name of the Servo42dModbus method, e.g. "relative_move_by_pulses".
+            *args, **kwargs: Passed through to the method.
+
+        #### Returns:
+            Future: Resolves to whatever the method returns, or holds the exception it raised.
+
+        #### Raises:
+            TypeError: If method_name is not a string.
+            AttributeError: If Servo42dModbus has no such method.
+
+        #### Example:
+            futures = [servo.submit("relative_move_by_pulses", Direction.CW, 10, 600, 3200, blocking=True) for servo in servos]
+            results = [future.result() for future in futures]
+
+        #### Last Revision:
+            2026-10-15 04:50 PM ET, Weston Forbes
+        """
+        if not TypeCheck.is_str(method_name): raise TypeError("method_name must be a string.")
+        return self._executor.submit(getattr(self.servo, method_name), *args, **kwargs)
+
+    async def run(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        #### Description:
+        Run any Servo42dModbus method on the servo's worker thread and await its result.
+
+        #### Args:
+            method_name (str): Name of the Servo42dModbus method, e.g. "set_zero".
+            *args, **kwargs: Passed through to the method.
+
+        #### Returns:
+            Any: Whatever the method returns. Exceptions raised by the method are raised here.
+
+        #### Raises:
+            TypeError: If method_name is not a string.
+            AttributeError: If Servo42dModbus has no such method.
+
+        #### Last Revision:
+            2026-10-15 04:50 PM ET, Weston Forbes
+        """
+        return await asyncio.wrap_future(self.submit(method_name, *args, **kwargs))
+
+    async def relative_move_by_pulses(self, direction: wf_types.Direction, acceleration: wf_types.uint_8, speed: wf_types.uint_16, pulses: wf_types.uint_32, verbose: bool = False, blocking: bool = False) -> bool:
+        """Awaitable Servo42dModbus.relative_move_by_pulses."""
+        return await self.run("relative_move_by_pulses", direction, acceleration, speed, pulses, verbose=verbose, blocking=blocking)
+
+    async def relative_move_by_degrees(self, direction: wf_types.Direction, acceleration: wf_types.uint_8, speed: wf_types.uint_16, degrees: float, verbose: bool = False, blocking: bool = False) -> bool:
+        """Awaitable Servo42dModbus.relative_move_by_degrees."""
+        return await self.run("relative_move_by_degrees", direction, acceleration, speed, degrees, verbose=verbose, blocking=blocking)
+
+    async def await_stop(self, timeout: float = 20.0, verbose: bool = False, settle: float = 0.1) -> bool:
+        """Awaitable Servo42dModbus.await_stop."""
+        return await self.run("await_stop", timeout=timeout, verbose=verbose, settle=settle)
+
+    async def move_at_speed(self, direction: wf_types.Direction, acceleration: wf_types.uint_8, speed: wf_types.uint_16, verbose: bool = False) -> bool:
+        """Awaitable Servo42dModbus.move_at_speed."""
+        return await self.run("move_at_speed", direction, acceleration, speed, verbose=verbose)
+
+    async def stop_movement(self, deceleration: wf_types.uint_8, verbose: bool = False) -> bool:
+        """Awaitable Servo42dModbus.stop_movement."""
+        return await self.run("stop_movement", deceleration, verbose=verbose)
+
+    async def read_encoder_value(self, verbose: bool = False) -> tuple:
+        """Awaitable Servo42dModbus.read_encoder_value."""
+        return await self.run("read_encoder_value", verbose=verbose)
+
+    async def read_state_block(self, verbose: bool = False) -> dict:
+        """Awaitable Servo42dModbus.read_state_block."""
+        return await self.run("read_state_block", verbose=verbose)
+
+    async def read_all_config_parameters(self, verbose: bool = False) -> dict:
+        """Awaitable Servo42dModbus.read_all_config_parameters."""
+        return await self.run("read_all_config_parameters", verbose=verbose)
+
+    async def setup_routine(self, verbose: bool = True, strict: bool = True) -> bool:
+        """Awaitable Servo42dModbus.setup_routine."""
+        return await self.run("setup_routine", verbose=verbose, strict=strict)
+
+    # endregion
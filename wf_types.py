@@ -1,15 +1,15 @@
 from typing import Annotated
-from enum import Enum
+from enum import IntEnum
 
 uint_8 = Annotated[int, "An unsigned 8-bit integer (0-255)"]
 uint_16 = Annotated[int, "An unsigned 16-bit integer (0-65535)"]
 uint_32 = Annotated[int, "An unsigned 32-bit integer (0-4294967295)"]
 
-class TriggerLevel(Enum):
+class TriggerLevel(IntEnum):
     LOW = 0
     HIGH = 1
 
-class HoldCurrentPercentage(Enum):
+class HoldCurrentPercentage(IntEnum):
     PERCENT_10 = 0
     PERCENT_20 = 1
     PERCENT_30 = 2
@@ -21,11 +21,11 @@ class HoldCurrentPercentage(Enum):
     PERCENT_90 = 8
     PERCENT_100 = 9
 
-class Direction(Enum):
+class Direction(IntEnum):
     CW = 0x00
     CCW = 0x01
 
-class WorkMode(Enum):
+class WorkMode(IntEnum):
     CR_OPEN = 0
     CR_CLOSE = 1
     CR_VFOC = 2
@@ -33,11 +33,11 @@ class WorkMode(Enum):
     SR_CLOSE = 4
     SR_VFOC = 5
 
-class EnableDisable(Enum):
+class EnableDisable(IntEnum):
     ENABLE = 1
     DISABLE = 0
 
-class Status(Enum):
+class Status(IntEnum):
     READ_FAIL = 0
     STOP = 1
     SPEED_UP = 2
@@ -47,29 +47,32 @@ class Status(Enum):
     CALIBRATION = 6
 
 class Parse:
+    # Each helper takes the bytes either as separate arguments (b1, b2, ...) or as one bytes-like object.
+
     @staticmethod
-    def parse_int16(b1, b2):
+    def parse_int16(*data):
         """Helper to parse a signed 16-bit integer from two bytes (big-endian)."""
-        val = (b1 << 8) | b2
-        return val - (1 << 16) if val & (1 << 15) else val
+        if len(data) == 1: data = data[0]
+        return int.from_bytes(data, 'big', signed=True)
 
     @staticmethod
-    def parse_int32(b1, b2, b3, b4):
+    def parse_int32(*data):
         """Helper to parse a signed 32-bit integer from four bytes (big-endian)."""
-        val = (b1 << 24) | (b2 << 16) | (b3 << 8) | b4
-        return val - (1 << 32) if val & (1 << 31) else val
+        if len(data) == 1: data = data[0]
+        return int.from_bytes(data, 'big', signed=True)
 
     @staticmethod
-    def parse_int48(b1, b2, b3, b4, b5, b6):
+    def parse_int48(*data):
         """Helper to parse a signed 48-bit integer from six bytes (big-endian)."""
-        val = (b1 << 40) | (b2 << 32) | (b3 << 24) | (b4 << 16) | (b5 << 8) | b6
-        return val - (1 << 48) if val & (1 << 47) else val
+        if len(data) == 1: data = data[0]
+        if len(data) != 6: raise ValueError("parse_int48 expects exactly 6 bytes.")
+        return int.from_bytes(data, 'big', signed=True)
     
     @staticmethod
-    def parse_uint32(b1, b2, b3, b4):
+    def parse_uint32(*data):
         """Helper to parse an unsigned 32-bit integer from four bytes (big-endian)."""
-        # For unsigned integers, we just combine the bytes with shifting. No two's complement correction is needed.
-        return (b1 << 24) | (b2 << 16) | (b3 << 8) | b4
+        if len(data) == 1: data = data[0]
+        return int.from_bytes(data, 'big')
 
 class TypeCheck:
 
@@ -93,6 +96,11 @@ class TypeCheck:
         """Check if value is a float."""
         return isinstance(value, float)
 
+    @staticmethod
+    def is_number(value) -> bool:
+        """Check if value is an int or a float (booleans excluded)."""
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+
     @staticmethod
     def is_uint8(value) -> bool:
         """Check if value is an integer in the uint8 range."""
@@ -108,7 +116,18 @@ class TypeCheck:
         """Check if value is a valid 32-bit unsigned integer (0-4294967295)."""
         return isinstance(value, int) and 0 <= value <= 4294967295
 
+    @staticmethod
+    def is_bytes(value) -> bool:
+        """Check if value is a bytes or bytearray object."""
+        return isinstance(value, (bytes, bytearray))
+
+    @staticmethod
+    def is_byte_buffer(value) -> bool:
+        """Check if value is a writable byte buffer (bytearray or writable memoryview)."""
+        return isinstance(value, bytearray) or (isinstance(value, memoryview) and not value.readonly)
+
     @staticmethod
     def is_int_list(value) -> bool:
         """Check if value is a list of integers."""
-        return isinstance(value, list) and all(isinstance(item, int) for item in value)
\ No newline at end of file
+        # map() drives the isinstance check from C, avoiding a generator frame per element.
+        return isinstance(value, list) and all(map(int.__instancecheck__, value))
\ No newline at end of file